@@ -3,17 +3,29 @@ ADB Manager - Handles all ADB communication
 """
 
 import subprocess
+import threading
 import time
 import os
 import re
 from pathlib import Path
 
+# Matches serials of authorized devices in `adb devices` output;
+# compiled once so the scan runs in the C regex engine
+DEVICE_LINE_RE = re.compile(r'^(\S+)\tdevice\b', re.M)
+
 class ADBManager:
     def __init__(self):
         self.adb_path = self.find_adb()
         self.devices = []
         self.timeout = 30
-    
+        self._shell_proc = None
+        # Serializes access to the shared shell; callers may issue
+        # session commands from worker threads
+        self._shell_lock = threading.Lock()
+        # ro.* properties cannot change while the device is booted,
+        # so reads are memoized for the manager's lifetime
+        self._prop_cache = {}
+
     def find_adb(self):
         """Find ADB executable in common locations"""
         possible_paths = [
@@ -91,6 +103,118 @@ class ADBManager:
                 'returncode': -1
             }
     
+    def shell_session_command(self, command):
+        """Run a shell command in a persistent adb shell session
+
+        Spawning adb costs 50-150ms of fork+exec per call, so device
+        shell commands reuse one long-lived `adb shell` process.
+        Commands are written to its stdin and output is read back up to
+        a sentinel. Returns the same dict shape as execute_command.
+        Safe to call from multiple threads: the session is a single
+        stdin/stdout pipe, so commands take turns on a lock.
+        """
+        with self._shell_lock:
+            try:
+                proc = self._persistent_shell()
+                proc.stdin.write(command + '; echo __END__\n')
+                proc.stdin.flush()
+
+                lines = []
+                ended = False
+                for line in proc.stdout:
+                    if line.strip() == '__END__':
+                        ended = True
+                        break
+                    lines.append(line)
+
+                if not ended:
+                    # Shell died (no device / disconnect); drop it so
+                    # the next call respawns a fresh session
+                    self.close_shell_session()
+                    return {
+                        'success': False,
+                        'output': '',
+                        'error': 'adb shell session ended',
+                        'returncode': -1
+                    }
+
+                return {
+                    'success': True,
+                    'output': ''.join(lines).strip(),
+                    'error': '',
+                    'returncode': 0
+                }
+            except Exception as e:
+                self.close_shell_session()
+                return {
+                    'success': False,
+                    'output': '',
+                    'error': str(e),
+                    'returncode': -1
+                }
+
+    def _persistent_shell(self):
+        """Lazy-spawn the long-lived adb shell process"""
+        if self._shell_proc is None or self._shell_proc.poll() is not None:
+            if not self.adb_path:
+                raise Exception("ADB not found")
+            self._shell_proc = subprocess.Popen(
+                [self.adb_path, 'shell'],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True,
+                bufsize=1
+            )
+        return self._shell_proc
+
+    def close_shell_session(self):
+        """Terminate the persistent shell session, if any"""
+        if self._shell_proc is not None:
+            try:
+                self._shell_proc.terminate()
+            except Exception:
+                pass
+            self._shell_proc = None
+
+    def __del__(self):
+        self.close_shell_session()
+
+    def getprop(self, key):
+        """Read one property, memoized across calls
+
+        Repeat lookups of the same key hit the cache instead of
+        paying another device round trip; batched reads share the
+        same cache.
+        """
+        if key not in self._prop_cache:
+            result = self.shell_session_command(f'getprop {key}')
+            self._prop_cache[key] = (result['output'].strip()
+                                     if result['success'] else '')
+        return self._prop_cache[key]
+
+    def getprops_batch(self, keys):
+        """Read several properties with one adb round trip
+
+        Chains the getprop calls in a single device-side shell command
+        separated by a sentinel, instead of one subprocess per property.
+        Only keys not already cached go to the device. Returns a dict
+        keyed by property name (missing props map to '').
+        """
+        missing = [key for key in keys if key not in self._prop_cache]
+        if missing:
+            script = '; echo ---; '.join(f'getprop {key}' for key in missing)
+            result = self.shell_session_command(script)
+
+            if result['success']:
+                values = result['output'].split('---')
+                for key, value in zip(missing, values):
+                    self._prop_cache[key] = value.strip()
+            for key in missing:
+                self._prop_cache.setdefault(key, '')
+
+        return {key: self._prop_cache[key] for key in keys}
+
     def wait_for_device(self, max_attempts=30):
         """Wait for device to be available"""
         print("Waiting for device...", end='', flush=True)
@@ -5,7 +5,7 @@ Device Scanner - Detects and analyzes connected Android devices
 import re
 import json
 from datetime import datetime
-from adb_manager import ADBManager
+from adb_manager import ADBManager, DEVICE_LINE_RE
 
 class DeviceScanner:
     def __init__(self):
@@ -24,27 +24,18 @@ class DeviceScanner:
         if not result['success']:
             print("Failed to scan devices")
             return []
-        
-        # Parse device list
-        lines = result['output'].strip().split('\n')
-        
-        if len(lines) <= 1:
+
+        # Parse device list with one compiled-regex scan
+        serials = DEVICE_LINE_RE.findall(result['output'])
+
+        if not serials:
             print("No devices found")
             return []
-        
-        for line in lines[1:]:
-            if not line.strip():
-                continue
-            
-            parts = line.split('\t')
-            if len(parts) >= 2:
-                serial = parts[0].strip()
-                status = parts[1].strip()
-                
-                if status == 'device':
-                    device_info = self._get_device_details(serial)
-                    self.scan_results.append(device_info)
-        
+
+        for serial in serials:
+            device_info = self._get_device_details(serial)
+            self.scan_results.append(device_info)
+
         return self.scan_results
     
     def _get_device_details(self, serial):
@@ -4,13 +4,45 @@ Factory Reset - Safe factory reset methods with data protection
 
 import time
 import os
+import sys
+import subprocess
 from pathlib import Path
 from adb_manager import ADBManager
 
+# Static warning text emitted with one write() instead of 20+ prints
+_RESET_WARNING = "\n" + "!" * 70 + """
+⚠️  CRITICAL WARNING: FACTORY RESET
+""" + "!" * 70 + """
+
+This will:
+  ❌ ERASE ALL USER DATA
+  ❌ Remove accounts and settings
+  ❌ Delete apps and app data
+  ❌ Wipe internal storage
+  ❌ Restore to factory state
+
+Data that will be LOST FOREVER:
+  - Photos and videos
+  - Contacts and messages
+  - Documents and downloads
+  - App data and settings
+  - Accounts and passwords
+
+⚠️  CANNOT BE UNDONE!
+Ensure you have BACKED UP everything important!
+"""
+
 class FactoryResetTool:
     def __init__(self):
         self.adb = ADBManager()
         self.warning_shown = False
+        # Brand choice -> hard reset handler, bound once instead of
+        # rebuilding an if/elif chain on every call
+        self._hard_reset_dispatch = {
+            '1': self._samsung_hard_reset,
+            '2': self._xiaomi_hard_reset,
+            '3': self._huawei_hard_reset,
+        }
     
     def perform_reset(self, method='safe'):
         """Perform factory reset with selected method"""
@@ -34,26 +66,9 @@ class FactoryResetTool:
     
     def _show_warning(self):
         """Show factory reset warnings"""
-        print("\n" + "!" * 70)
-        print("⚠️  CRITICAL WARNING: FACTORY RESET")
-        print("!" * 70)
-        print("\nThis will:")
-        print("  ❌ ERASE ALL USER DATA")
-        print("  ❌ Remove accounts and settings")
-        print("  ❌ Delete apps and app data")
-        print("  ❌ Wipe internal storage")
-        print("  ❌ Restore to factory state")
-        
-        print("\nData that will be LOST FOREVER:")
-        print("  - Photos and videos")
-        print("  - Contacts and messages")
-        print("  - Documents and downloads")
-        print("  - App data and settings")
-        print("  - Accounts and passwords")
-        
-        print("\n⚠️  CANNOT BE UNDONE!")
-        print("Ensure you have BACKED UP everything important!")
-        
+        sys.stdout.write(_RESET_WARNING)
+        sys.stdout.flush()
+
         response = input("\nType 'I UNDERSTAND' to continue: ")
         if response != 'I UNDERSTAND':
             print("Reset cancelled.")
@@ -182,34 +197,56 @@ class FactoryResetTool:
             ("fastboot format userdata", "Format user data"),
             ("fastboot -w", "Wipe userdata and cache"),
         ]
-        
+
+        # Full wipe chains everything through one shell so fastboot
+        # starts up once instead of per command
+        full_wipe_chain = (
+            "fastboot erase userdata && fastboot erase cache"
+            " && fastboot -w && fastboot reboot"
+        )
+
         print("\nAvailable fastboot wipe commands:")
         for cmd, desc in commands:
             print(f"  {cmd} - {desc}")
-        
+        print(f"  Full wipe - {full_wipe_chain}")
+
         print("\n⚠️  RECOMMENDED: Use recovery mode instead!")
         print("Fastboot is for advanced users only")
-        
+
         result = input("\nUse fastboot? (y/n): ").lower()
         if result != 'y':
             return False
-        
-        print("\nSelect command to run (1-4): ", end='')
+
+        print("\nSelect command to run (1-4, 5=full wipe): ", end='')
         choice = input().strip()
-        
-        if choice in ['1', '2', '3', '4']:
+
+        if choice == '5':
+            print(f"\nExecuting: {full_wipe_chain}")
+            print("Description: Full wipe and reboot in one batch")
+
+            confirm = input("Type 'EXECUTE' to run: ")
+            if confirm == 'EXECUTE':
+                try:
+                    subprocess.run(full_wipe_chain, shell=True, timeout=120)
+                    print("Full wipe executed. Device rebooting...")
+                    return True
+                except Exception as e:
+                    print(f"Error: {e}")
+                    return False
+
+        elif choice in ['1', '2', '3', '4']:
             cmd_index = int(choice) - 1
             cmd, desc = commands[cmd_index]
-            
+
             print(f"\nExecuting: {cmd}")
             print(f"Description: {desc}")
-            
+
             confirm = input("Type 'EXECUTE' to run: ")
             if confirm == 'EXECUTE':
                 try:
                     subprocess.run(cmd.split(), timeout=30)
                     print("Command executed.")
-                    
+
                     # Reboot
                     subprocess.run(['fastboot', 'reboot'], timeout=10)
                     print("Device rebooting...")
@@ -217,7 +254,7 @@ class FactoryResetTool:
                 except Exception as e:
                     print(f"Error: {e}")
                     return False
-        
+
         return False
     
     def _frp_reset(self):
@@ -286,21 +323,18 @@ class FactoryResetTool:
         print("4. Other")
         
         choice = input("\nEnter choice: ").strip()
-        
-        if choice == '1':
-            self._samsung_hard_reset()
-        elif choice == '2':
-            self._xiaomi_hard_reset()
-        elif choice == '3':
-            self._huawei_hard_reset()
-        else:
-            print("\nGeneral hard reset steps:")
-            print("1. Find device-specific guide online")
-            print("2. Look for 'test point' or 'EDL mode'")
-            print("3. Use manufacturer flash tools")
-            print("4. Follow instructions precisely")
-        
+
+        self._hard_reset_dispatch.get(choice, self._generic_hard_reset)()
+
         return False
+
+    def _generic_hard_reset(self):
+        """Generic hard reset guidance for other brands"""
+        print("\nGeneral hard reset steps:")
+        print("1. Find device-specific guide online")
+        print("2. Look for 'test point' or 'EDL mode'")
+        print("3. Use manufacturer flash tools")
+        print("4. Follow instructions precisely")
     
     def _samsung_hard_reset(self):
         """Samsung-specific hard reset methods"""
@@ -320,7 +354,41 @@ class FactoryResetTool:
         print("\n✅ Recommendation:")
         print("Use Samsung authorized service")
         print("Provide proof of purchase")
-    
+
+    def _xiaomi_hard_reset(self):
+        """Xiaomi-specific hard reset methods"""
+        print("\n📱 XIAOMI HARD RESET")
+
+        print("Common methods:")
+        print("1. EDL mode flash (test point)")
+        print("2. Mi Flash with authorized account")
+        print("3. Fastboot flash (unlocked bootloader)")
+
+        print("\n⚠️  Xiaomi protection:")
+        print("- EDL flashing needs authorized Mi account")
+        print("- Bootloader unlock has waiting period")
+
+        print("\n✅ Recommendation:")
+        print("Use Xiaomi authorized service")
+        print("Provide proof of purchase")
+
+    def _huawei_hard_reset(self):
+        """Huawei-specific hard reset methods"""
+        print("\n📱 HUAWEI HARD RESET")
+
+        print("Common methods:")
+        print("1. eRecovery (Vol Up + Power while charging)")
+        print("2. HiSuite system recovery")
+        print("3. Test point / board flash (service level)")
+
+        print("\n⚠️  Huawei protection:")
+        print("- Bootloader unlock no longer offered")
+        print("- FRP tied to Huawei ID on newer models")
+
+        print("\n✅ Recommendation:")
+        print("Use Huawei authorized service")
+        print("Provide proof of purchase")
+
     def post_reset_setup(self):
         """Guide for setup after factory reset"""
         print("\n🔄 POST-RESET SETUP GUIDE")
